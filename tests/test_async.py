@@ -0,0 +1,62 @@
+import asyncio
+import time
+
+import pytest
+
+import tukaan
+from tests.base import with_app_context
+from tukaan._async import AsyncioBridge
+from tukaan._tcl import Tcl
+from tukaan.timeouts import Timer, timer_wheel
+
+
+@with_app_context
+def test_coroutine_callback(app, window):
+    result = []
+
+    async def callback():
+        await asyncio.sleep(0.05)
+        result.append(await asyncio.get_running_loop().run_in_executor(None, lambda: 42))
+
+    bridge = AsyncioBridge()
+    try:
+        button = tukaan.Button(window, action=callback)
+        button.invoke()
+
+        deadline = time.monotonic() + 2
+        while not result and time.monotonic() < deadline:
+            Tcl.do_one_event()
+    finally:
+        bridge.close()
+
+    assert result == [42]
+
+
+@with_app_context
+def test_run_async(app, window):
+    fired = []
+
+    async def main():
+        try:
+            timer_fired = asyncio.Event()
+            Timer.schedule(0.02, lambda: (fired.append(True), timer_fired.set()))
+            assert timer_wheel._loop_handle is not None  # Armed as an asyncio timer
+
+            await asyncio.wait_for(timer_fired.wait(), 2)
+            await tukaan.sleep(0.01)
+        finally:
+            Tcl._interp.quit()
+
+    app.run_async(main())
+
+    assert fired == [True]
+    assert timer_wheel._loop is None
+
+
+@with_app_context
+def test_unsupported_loop_is_rejected(app, window):
+    class ForeignLoop(asyncio.AbstractEventLoop):
+        pass
+
+    with pytest.raises(TypeError, match="BaseEventLoop"):
+        AsyncioBridge(ForeignLoop())
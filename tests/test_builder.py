@@ -0,0 +1,47 @@
+import tukaan
+from tests.base import with_app_context
+from tukaan import profiling
+
+
+@with_app_context
+def test_build_widget_tree(app, window):
+    widgets = tukaan.build(
+        window,
+        {
+            "type": tukaan.Frame,
+            "grid": {"row": 0, "col": 0},
+            "name": "page",
+            "children": [
+                {"type": tukaan.Label, "options": {"text": "Name"}, "grid": {"row": 0}},
+                {
+                    "type": tukaan.Button,
+                    "options": {"text": "OK"},
+                    "grid": {"row": 1},
+                    "name": "ok",
+                },
+            ],
+        },
+    )
+
+    page, ok = widgets["page"], widgets["ok"]
+    assert ok.parent is page
+    assert ok.text == "OK"
+    assert len(page._children) == 2
+    assert ok.grid.row == 1
+
+
+@with_app_context
+def test_build_flushes_once(app, window):
+    spec = {
+        "type": tukaan.Frame,
+        "grid": {"row": 1, "col": 0},
+        "children": [
+            {"type": tukaan.Label, "options": {"text": str(i)}, "grid": {"row": i}}
+            for i in range(5)
+        ],
+    }
+
+    with profiling.profile() as profile:
+        tukaan.build(window, spec)
+
+    assert profile.snapshot()["::tukaan::batch"].count == 1
@@ -0,0 +1,148 @@
+import tukaan
+from tests.base import update, with_app_context
+from tukaan import profiling
+from tukaan._tcl import Tcl
+
+
+@with_app_context
+def test_mouse_motion_event(app, window):
+    label = tukaan.Label(window, text="Text")
+    label.grid()
+    update()
+
+    events = []
+    label.bind("<MouseMotion>", events.append, send=True)
+    Tcl.call(None, "event", "generate", label, "<Motion>", "-x", 5, "-y", 6, "-state", 4)
+
+    event = events[0]
+    assert event.widget is label
+    assert event.sequence == "<MouseMotion>"
+    assert (event.rel_x, event.rel_y) == (5, 6)
+    assert event.modifiers == {"Control"}
+    assert event.button is None
+
+    label.unbind("<MouseMotion>")
+
+
+@with_app_context
+def test_virtual_event_data(app, window):
+    received = []
+    window.bind("<<Custom>>", lambda event: received.append(event.data), send=True)
+    window.generate_event("<<Custom>>", data={"key": "value"})
+
+    assert received == [{"key": "value"}]
+
+    window.unbind("<<Custom>>")
+
+
+@with_app_context
+def test_unbind_by_id(app, window):
+    calls = []
+    first = window.bind("<<Custom>>", lambda: calls.append("first"))
+    second = window.bind("<<Custom>>", lambda: calls.append("second"))
+    assert first != second
+
+    window.unbind("<<Custom>>", first)
+    window.generate_event("<<Custom>>")
+    assert calls == ["second"]
+
+    window.unbind("<<Custom>>")
+    window.generate_event("<<Custom>>")
+    assert calls == ["second"]
+
+
+@with_app_context
+def test_coalesced_motion_delivers_latest_position(app, window):
+    label = tukaan.Label(window, text="Text")
+    label.grid()
+    update()
+
+    events = []
+    label.bind("<MouseMotion>", events.append, send=True, coalesce=True)
+    for x in range(10):
+        Tcl.call(None, "event", "generate", label, "<Motion>", "-x", x, "-y", 0)
+    update()
+
+    assert len(events) == 1
+    assert events[0].rel_x == 9
+
+    label.unbind("<MouseMotion>")
+
+
+@with_app_context
+def test_when_filters_in_tcl(app, window):
+    entry = tukaan.TextBox(window)
+    entry.grid()
+    Tcl.call(None, "focus", "-force", entry)
+    update()
+
+    keys = []
+    entry.bind(
+        "<KeyDown>",
+        lambda event: keys.append(event.keysymbol),
+        send=True,
+        when={"keysymbol": "Enter"},
+    )
+    with profiling.profile() as profile:
+        for keysym in ("a", "b", "Return"):
+            Tcl.call(None, "event", "generate", entry, "<KeyPress>", "-keysym", keysym)
+        update()
+
+    assert keys == ["Enter"]
+    assert profile.snapshot()["callback _Bindings._dispatch"].count == 1
+
+    entry.unbind("<KeyDown>")
+
+
+@with_app_context
+def test_app_shortcuts_are_scoped(app, window):
+    entry = tukaan.TextBox(window)
+    entry.grid()
+    Tcl.call(None, "focus", "-force", entry)
+    update()
+
+    calls = []
+    save = tukaan.KeySeq("Ctrl_Ctrl", "s")
+    app.shortcuts.add(save, lambda: calls.append("app"))
+    app.shortcuts.add(save, lambda: calls.append("entry"), scope=entry)
+
+    Tcl.call(None, "event", "generate", entry, "<KeyPress>", "-keysym", "s", "-state", 4)
+    app.shortcuts.remove(save, scope=entry)
+    Tcl.call(None, "event", "generate", entry, "<KeyPress>", "-keysym", "s", "-state", 4)
+    app.shortcuts.remap(save, tukaan.KeySeq("F5"))
+    Tcl.call(None, "event", "generate", entry, "<KeyPress>", "-keysym", "F5")
+    update()
+
+    assert calls == ["entry", "app", "app"]
+    app.shortcuts.remove(tukaan.KeySeq("F5"))
+
+
+@with_app_context
+def test_event_bus(app, window):
+    received = []
+
+    class Handler:
+        def on_saved(self, data):
+            received.append(("handler", data))
+
+    handler = Handler()
+    app.event_bus.subscribe("<<Saved>>", handler.on_saved)
+    app.event_bus.subscribe("<<Saved>>", lambda data: received.append(("function", data)))
+
+    app.event_bus.publish("<<Saved>>", "direct")
+    assert received == [("handler", "direct"), ("function", "direct")]
+
+    del handler
+    app.event_bus.publish("<<Saved>>", "via tk", via_tk=True)
+    update()
+    assert received[2:] == [("function", "via tk")]
+
+
+@with_app_context
+def test_tab_dragging_breaks_class_bindings(app, window):
+    tabview = tukaan.TabView(window)
+    tabview.enable_tab_dragging()
+
+    script = Tcl.call(str, "bind", tabview, "<B1-Motion>")
+    assert "break" in script
+    assert "::tukaan::coalesce" not in script  # Every motion event moves the tab
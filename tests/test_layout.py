@@ -0,0 +1,77 @@
+import pytest
+
+import tukaan
+from tests.base import with_app_context
+from tukaan import profiling
+from tukaan._tcl import Tcl
+from tukaan.enums import Orientation
+from tukaan.exceptions import LayoutError
+
+
+@with_app_context
+def test_place_many(app, window):
+    labels = [tukaan.Label(window, text=str(i)) for i in range(3)]
+    window.grid.place_many((label, {"row": i, "col": 1}) for i, label in enumerate(labels))
+
+    assert [label.grid.location for label in labels] == [(0, 1), (1, 1), (2, 1)]
+
+
+@with_app_context
+def test_grid_info_is_cached_until_changed(app, window):
+    label = tukaan.Label(window)
+    label.grid(row=2, col=3)
+
+    with profiling.profile() as profile:
+        assert label.grid.row == 2
+        assert label.grid.col == 3
+        label.grid.row = 4
+        assert label.grid.row == 4
+
+    assert profile.snapshot()["grid info"].count == 2
+
+
+@with_app_context
+def test_cells_regrid_only_changed_widgets(app, window):
+    frame = tukaan.Frame(window)
+    frame.grid.cells = [["a", "b"]]
+    first, second = tukaan.Label(frame), tukaan.Label(frame)
+    first.grid(cell="a")
+    second.grid(cell="b")
+
+    with profiling.profile() as profile:
+        frame.grid.cells = [["a", "c"], ["b", "b"]]
+
+    assert profile.snapshot()["grid configure"].count == 1
+    assert second.grid.location == (1, 0)
+    assert second.grid.colspan == 2
+
+
+@with_app_context
+def test_removing_a_used_cell_raises(app, window):
+    frame = tukaan.Frame(window)
+    frame.grid.cells = [["a", "b"]]
+    tukaan.Label(frame).grid(cell="b")
+
+    with pytest.raises(LayoutError):
+        frame.grid.cells = [["a", "a"]]
+
+
+@with_app_context
+def test_radio_group_regrid_updates_layout_info(app, window):
+    group = tukaan.RadioGroup(window, items={"a": "A", "b": "B"})
+    radio = group["b"]
+    assert radio.grid.location == (1, 0)
+
+    group._orient = Orientation.Horizontal
+    group._regrid()
+    assert radio.grid.location == (0, 1)
+
+
+@with_app_context
+def test_grid_info_follows_changes_made_in_tcl(app, window):
+    label = tukaan.Label(window)
+    label.grid(row=2, col=3)
+    assert label.grid.row == 2
+
+    Tcl.call(None, "grid", "configure", label, "-row", 5)
+    assert label.grid.row == 5
@@ -0,0 +1,60 @@
+import time
+
+import tukaan
+from tests.base import with_app_context
+from tukaan import profiling
+from tukaan._tcl import Tcl
+
+
+@with_app_context
+def test_scoped_profile(app, window):
+    original_call = Tcl.call
+
+    with profiling.profile() as profile:
+        label = tukaan.Label(window, text="Text")
+        label.text
+        label.text
+        Tcl.eval(None, "update idletasks")
+
+    stats = profile.snapshot()
+    assert stats["<ttk::label> cget"].count == 2
+    assert stats["update idletasks"].count == 1
+    assert all("test_profiling.py" in site for site in stats["<ttk::label> cget"].call_sites)
+    assert Tcl.call == original_call
+
+
+@with_app_context
+def test_global_profile_records_callbacks(app, window):
+    def callback():
+        pass
+
+    profiling.reset()
+    profiling.enable()
+    try:
+        button = tukaan.Button(window, action=callback)
+        button.invoke()
+    finally:
+        profiling.disable()
+
+    stats = profiling.snapshot()
+    assert stats["<ttk::button> invoke"].count == 1
+    assert any(name.endswith("callback") for name in stats if name.startswith("callback "))
+
+
+@with_app_context
+def test_stall_watchdog(app, window):
+    def slow_callback():
+        time.sleep(0.2)
+
+    stalls = []
+    button = tukaan.Button(window, action=slow_callback)
+
+    with profiling.StallWatchdog(budget=0.05, on_stall=stalls.append) as watchdog:
+        button.invoke()
+        button.invoke()
+
+    assert len(stalls) == 2
+    assert "slow_callback" in stalls[0].callback
+    assert any("time.sleep" in line for line in stalls[0].stack)
+    assert sum(watchdog.histogram.values()) == 2
+    assert watchdog.histogram[0.25] == 2
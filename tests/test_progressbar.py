@@ -0,0 +1,54 @@
+import threading
+import time
+
+import tukaan
+from tests.base import with_app_context
+from tukaan._tcl import Tcl
+
+
+@with_app_context
+def test_track_background_task(app, window):
+    can_finish = threading.Event()
+    progress_updates = []
+    results = []
+
+    def work(count, progress):
+        for i in range(count):
+            progress((i + 1) / count)
+        can_finish.wait()
+        return count
+
+    progressbar = tukaan.ProgressBar(window, length=10)
+    task = app.run_in_background(
+        work, 100, on_done=results.append, on_progress=progress_updates.append
+    )
+    progressbar.track(task)
+
+    deadline = time.monotonic() + 2
+    while task.progress < 1 and time.monotonic() < deadline:
+        Tcl.do_one_event()
+
+    assert progressbar.value == 10
+    assert len(progress_updates) < 100
+
+    can_finish.set()
+    while not results and time.monotonic() < deadline:
+        Tcl.do_one_event()
+
+    assert results == [100]
+
+
+@with_app_context
+def test_background_task_error(app, window):
+    errors = []
+
+    def work():
+        raise ValueError("failed")
+
+    app.run_in_background(work, on_done=errors.append, on_error=errors.append)
+
+    deadline = time.monotonic() + 2
+    while not errors and time.monotonic() < deadline:
+        Tcl.do_one_event()
+
+    assert [type(error) for error in errors] == [ValueError]
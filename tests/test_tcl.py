@@ -0,0 +1,333 @@
+import _tkinter
+import gc
+import threading
+import time
+import weakref
+
+import pytest
+
+import tukaan
+from tests.base import update, with_app_context
+from tukaan import profiling
+from tukaan._props import cget, config
+from tukaan._tcl import Tcl, TclCallback
+from tukaan.exceptions import TukaanTclError
+
+
+@with_app_context
+def test_batch_queues_calls_until_exit(app, window):
+    Tcl.call(None, "set", "tukaan_test_batch", 0)
+
+    with app.batch():
+        Tcl.call(None, "set", "tukaan_test_batch", 1)
+        assert Tcl._batch
+        Tcl.eval(None, "incr tukaan_test_batch")
+
+    assert not Tcl._batch
+    assert Tcl.call(int, "set", "tukaan_test_batch") == 2
+
+
+@with_app_context
+def test_batch_flushes_before_reads(app, window):
+    with app.batch():
+        button = tukaan.Button(window, text="Text")
+        assert button.text == "Text"
+        button.text = "Other text"
+
+    assert button.text == "Other text"
+
+
+@with_app_context
+def test_batch_error_points_to_call_site(app, window):
+    with pytest.raises(TukaanTclError, match="test_tcl.py"):
+        with app.batch():
+            Tcl.call(None, "tukaan_nonexistent_command")
+
+    assert Tcl._batch is None
+
+
+@with_app_context
+def test_to_tcl_conversion(app, window):
+    assert Tcl.to("foo") == "foo"
+    assert Tcl.to(True) == "1"
+    assert Tcl.to(1.5) == "1.5"
+    assert Tcl.to(window) == window._name
+    assert Tcl.to({"a": 1}) == ("a", "1")
+    assert Tcl.to([1, (2, 3)]) == ("1", ("2", "3"))
+
+    with pytest.raises(TypeError):
+        Tcl.to(None)
+
+
+@with_app_context
+def test_register_encoder(app, window):
+    class Point:
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+
+    Tcl.register_encoder(Point, lambda point: (str(point.x), str(point.y)))
+    try:
+        assert Tcl.to(Point(1, 2)) == ("1", "2")
+    finally:
+        Tcl.unregister_encoder(Point)
+
+    with pytest.raises(TypeError):
+        Tcl.to(Point(1, 2))
+
+
+@with_app_context
+def test_compiled_decoder(app, window):
+    decoder = Tcl.compile_decoder({"-padx": (int,), "-sticky": str})
+
+    assert Tcl.compile_decoder({"-padx": (int,), "-sticky": str}) is decoder
+    assert Tcl.call(decoder, "list", "-padx", "1 2", "-sticky", "nw") == {
+        "-padx": (1, 2),
+        "-sticky": "nw",
+    }
+    assert Tcl.from_((int, str), "1 2 3") == (1, "2", "3")
+    assert Tcl.from_([int], "1 2 3") == [1, 2, 3]
+    assert Tcl.from_({int}, "1 1 2") == {1, 2}
+
+
+@with_app_context
+def test_compiled_decoders_with_tcl_objects(app, window):
+    Tcl._interp.wantobjects(True)
+    try:
+        nested = Tcl.compile_decoder([(str, (int,))])
+        assert Tcl.call(nested, "list", ("a", (1, 2)), ("b", (3,))) == [("a", (1, 2)), ("b", (3,))]
+        assert Tcl.call([[int]], "list", (1, 2), (3,)) == [[1, 2], [3]]
+        assert Tcl.call((float, bool), "list", 1.5, True) == (1.5, True)
+        assert Tcl.call({str}, "lrepeat", 3, "x") == {"x"}
+
+        # Tcl_Obj values, that aren't converted to Python objects by _tkinter
+        options = Tcl.call(object, "dict", "create", "-padx", (1, 2), "-sticky", "nw")
+        assert isinstance(options, _tkinter.Tcl_Obj)
+        assert Tcl.compile_decoder({"-padx": (int,), "-sticky": str})(options) == {
+            "-padx": (1, 2),
+            "-sticky": "nw",
+        }
+        assert Tcl.call([str], "dict", "create", "a", "b c") == ["a", "b c"]
+
+        # A number is also a list with a single item
+        assert Tcl.call((int,), "expr", "6 * 7") == (42,)
+        assert Tcl.call([float], "expr", "1.5") == [1.5]
+    finally:
+        Tcl._interp.wantobjects(False)
+
+
+def tcl_commands_used(func):
+    start = Tcl.call(int, "info", "cmdcount")
+    func()
+    return Tcl.call(int, "info", "cmdcount") - start
+
+
+@with_app_context
+def test_string_reads_dont_need_extra_tcl_commands(app, window):
+    textbox = tukaan.TextBox(window, value="Some text")
+    baseline = tcl_commands_used(lambda: None)
+    raw_read = tcl_commands_used(lambda: Tcl.call(None, textbox, "get")) - baseline
+
+    assert tcl_commands_used(textbox.get) - baseline == raw_read
+    assert tcl_commands_used(lambda: textbox.hide_chars_with) - baseline == raw_read
+    assert Tcl.from_(str, 42) == "42"
+
+
+@with_app_context
+def test_commands_are_shared_and_released(app, window):
+    def callback():
+        pass
+
+    assert Tcl.to(callback) == Tcl.to(callback)
+
+    before = sum(app.live_commands.values())
+    button = tukaan.Button(window, action=callback)
+    button.action = callback
+    button.action = lambda: None
+    button.bind("<MouseDown>", lambda: None)
+    assert app.live_commands["Button"] == 1  # Bindings go through one dispatcher command
+
+    button.destroy()
+    assert "Button" not in app.live_commands
+    assert sum(app.live_commands.values()) <= before
+
+
+@with_app_context
+def test_bound_method_command_doesnt_keep_widget_alive(app, window):
+    class ClickableButton(tukaan.Button):
+        def on_click(self):
+            pass
+
+    button = ClickableButton(window)
+    button.action = button.on_click
+    assert button.action == button.on_click
+
+    button_ref = weakref.ref(button)
+    button.destroy()
+    del button
+    gc.collect()
+
+    assert button_ref() is None
+
+
+@with_app_context
+def test_bound_method_commands_are_owned_by_their_object(app, window):
+    class Handler:
+        def handle(self):
+            pass
+
+    handler = Handler()
+    name = Tcl.to(handler.handle)
+    assert Tcl.to(handler.handle) == name
+    assert TclCallback.register(handler, "key", handler.handle) == name
+
+    del handler
+    gc.collect()
+
+    assert TclCallback.lookup(name) is None
+    assert Tcl.call(str, "info", "commands", name) == ""
+
+
+@with_app_context
+def test_call_soon_threadsafe(app, window):
+    label = tukaan.Label(window, text="")
+    futures = []
+
+    def worker():
+        for i in range(50):
+            futures.append(app.call_soon_threadsafe(setattr, label, "text", str(i)))
+        futures.append(app.call_soon_threadsafe(lambda: label.text))
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    while not all(future.done() for future in futures):
+        Tcl.do_one_event()
+
+    assert futures[-1].result() == "49"
+
+
+@with_app_context
+def test_reads_flush_idle_tasks_once(app, window):
+    label = tukaan.Label(window, text="Text")
+    label.grid()
+
+    with profiling.profile() as profile:
+        label.bbox
+        label.width
+        label.height
+
+    assert profile.snapshot()["update idletasks"].count == 1
+
+
+@with_app_context
+def test_request_frame(app, window):
+    frames = []
+
+    Tcl.request_frame(frames.append)
+    cancelled = Tcl.request_frame(frames.append)
+    Tcl.cancel_frame(cancelled)
+    update()
+
+    assert len(frames) == 1
+
+
+@with_app_context
+def test_frames_are_paced_and_not_run_by_sync(app, window):
+    frames = []
+
+    def animate(timestamp):
+        frames.append(timestamp)
+        if len(frames) < 3:
+            Tcl.request_frame(animate)
+
+    Tcl.request_frame(animate)
+    Tcl._dirty = True
+    Tcl.sync()
+    assert frames == []
+
+    deadline = time.monotonic() + 2
+    while len(frames) < 3 and time.monotonic() < deadline:
+        Tcl.do_one_event()
+
+    assert len(frames) == 3
+    assert frames[2] - frames[1] >= 15
+
+
+@with_app_context
+def test_events_from_the_event_loop_mark_dirty(app, window):
+    future = app.call_soon_threadsafe(lambda: None)
+    Tcl._dirty = False
+
+    deadline = time.monotonic() + 2
+    while not future.done() and time.monotonic() < deadline:
+        Tcl._interp.dooneevent(_tkinter.DONT_WAIT)
+
+    assert Tcl._dirty
+
+
+@with_app_context
+def test_option_cache(app, window):
+    label = tukaan.Label(window, text="Text")
+    label.cache_options = True
+
+    with profiling.profile() as profile:
+        assert label.text == "Text"
+        label.text = "New text"
+        assert label.text == "New text"
+
+    assert "<ttk::label> cget" not in profile.snapshot()
+    assert Tcl.call(str, label, "cget", "-text") == "New text"
+
+    label.cache_options = False
+    assert not label.cache_options
+
+
+@with_app_context
+def test_option_cache_reads_normalized_values(app, window):
+    frame = tukaan.Frame(window)
+    frame.cache_options = True
+
+    config(frame, padding=(1, 2))
+    assert cget(frame, str, "-padding") == Tcl.call(str, frame, "cget", "-padding")
+
+
+@with_app_context
+def test_option_cache_doesnt_serve_volatile_options(app, window):
+    button = tukaan.Button(window, text="Text")
+    button.cache_options = True
+    assert cget(button, str, "-state") == "normal"
+
+    Tcl.call(None, button, "configure", "-state", "disabled")  # Changed behind the cache's back
+    assert cget(button, str, "-state") == "disabled"
+
+    Tcl.call(None, "event", "generate", button, "<<TkWorldChanged>>")
+    assert button._option_cache == {}
+
+
+@with_app_context
+def test_configure_sends_one_call(app, window):
+    label = tukaan.Label(window)
+
+    with profiling.profile() as profile:
+        label.configure(text="Text", focusable=True)
+
+    assert profile.snapshot()["<ttk::label> configure"].count == 1
+    assert (label.text, label.focusable) == ("Text", True)
+
+    with pytest.raises(AttributeError):
+        label.configure(text="Other", nonexistent=1)
+    assert label.text == "Text"
+
+
+@with_app_context
+def test_failed_batched_configure_resets_option_cache(app, window):
+    label = tukaan.Label(window, text="Text")
+    label.cache_options = True
+    assert label.text == "Text"
+
+    with pytest.raises(TukaanTclError):
+        with Tcl.batch():
+            config(label, text="Rejected", underline="not a number")
+
+    assert label.text == Tcl.call(str, label, "cget", "-text")
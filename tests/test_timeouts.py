@@ -0,0 +1,182 @@
+import time
+
+import tukaan
+from tests.base import with_app_context
+from tukaan._tcl import Tcl
+from tukaan.timeouts import IdleScheduler, Timeout, timer_wheel
+
+
+def run_until(predicate, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        Tcl.do_one_event()
+
+
+@with_app_context
+def test_repeated_timeout_does_not_drift(app, window):
+    calls = []
+    timeout = Timeout(0.01, lambda: calls.append(time.monotonic()))
+
+    start = time.monotonic()
+    timeout.repeat()
+    run_until(lambda: len(calls) == 20)
+    timeout.cancel()
+
+    assert calls[-1] - start < 0.2 + 0.015
+    assert timeout.state == "cancelled"
+
+
+@with_app_context
+def test_timer_wheel_cancel(app, window):
+    called = []
+    handles = [timer_wheel.call_later(i / 1000, called.append, i) for i in range(1000)]
+    for handle in handles[1::2]:
+        timer_wheel.cancel(handle)
+
+    run_until(lambda: len(called) == 500)
+
+    assert called == list(range(0, 1000, 2))
+    assert len(timer_wheel) == 0
+
+
+@with_app_context
+def test_schedule_idle(app, window):
+    order = []
+
+    def job(name, steps):
+        for _ in range(steps):
+            time.sleep(0.001)
+            order.append(name)
+            yield
+
+    low = app.schedule_idle(job("low", 5))
+    high = app.schedule_idle(job("high", 20), priority=1)
+    cancelled = app.schedule_idle(job("cancelled", 5))
+    cancelled.cancel()
+
+    run_until(lambda: low.state == high.state == "completed")
+
+    assert order == ["high"] * 20 + ["low"] * 5
+    assert cancelled.state == "cancelled"
+
+
+@with_app_context
+def test_sync_runs_at_most_one_idle_slot(app, window):
+    steps = []
+
+    def job():
+        for _ in range(50):
+            time.sleep(0.002)
+            steps.append(None)
+            yield
+
+    task = app.schedule_idle(job(), budget_ms=1)
+    Tcl._dirty = True
+    Tcl.sync()
+    Tcl._dirty = True
+    Tcl.sync()
+
+    assert len(steps) <= 1
+
+    task.cancel()
+
+
+@with_app_context
+def test_idle_scheduler_reports_starvation(app, window):
+    starved = []
+
+    def job():
+        for _ in range(20):
+            time.sleep(0.005)
+            yield
+
+    scheduler = IdleScheduler(starvation_ms=10, on_starvation=lambda task, _: starved.append(task))
+    busy = scheduler.schedule(job(), priority=1, budget_ms=30)
+    waiting = scheduler.schedule(job(), budget_ms=30)
+
+    run_until(lambda: waiting.state == "completed")
+
+    assert busy.state == "completed"
+    assert starved == [waiting]
+
+
+@with_app_context
+def test_sleep_in_task(app, window):
+    log = []
+
+    async def job(delay):
+        await tukaan.sleep(delay)
+        log.append(delay)
+        return delay
+
+    async def main():
+        first, second = tukaan.Task(job(0.03)), tukaan.Task(job(0.01))
+        log.append(await first + await second)
+
+    task = tukaan.Task(main())
+    run_until(lambda: task.state == "completed")
+
+    assert log == [0.01, 0.03, 0.04]
+
+
+@with_app_context
+def test_cancel_task_waiting_for_another(app, window):
+    states = []
+
+    async def main():
+        await child
+
+    child = tukaan.Task(tukaan.sleep(0.01))
+    task = tukaan.Task(main())
+    task.add_done_callback(lambda task: states.append(task.state))
+    run_until(lambda: task._handle is None)
+
+    task.cancel()
+    run_until(lambda: child.state == "completed")
+
+    assert states == ["cancelled"]
+
+
+@with_app_context
+def test_awaiting_a_failed_task_raises(app, window):
+    caught = []
+
+    async def fail():
+        raise ValueError("failed")
+
+    async def main():
+        try:
+            await tukaan.Task(fail())
+        except ValueError as e:
+            caught.append(e)
+
+    task = tukaan.Task(main())
+    run_until(lambda: task.state != "pending")
+
+    assert task.state == "completed"
+    assert [str(e) for e in caught] == ["failed"]
+
+
+@with_app_context
+def test_overlapping_delayed_calls(app, window):
+    calls = []
+
+    @tukaan.Timer.delayed_task(0.01)
+    def delayed(value):
+        calls.append(value)
+        return value
+
+    tasks = [delayed(1), delayed(2)]
+    run_until(lambda: all(task.state == "completed" for task in tasks))
+
+    assert calls == [1, 2]
+    assert [task.result() for task in tasks] == [1, 2]
+
+
+@with_app_context
+def test_delayed_returns_the_result(app, window):
+    @tukaan.Timer.delayed(0.01)
+    def delayed(value):
+        return value * 2
+
+    assert delayed(21) == 42
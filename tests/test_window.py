@@ -1,7 +1,9 @@
 from pathlib import Path
 
 import tukaan
-from tests.base import with_app_context
+from tests.base import update, with_app_context
+from tukaan import profiling
+from tukaan._tcl import Tcl
 
 
 @with_app_context
@@ -35,3 +37,83 @@ def test_window_icon_icon_object(app, window):
     icon = tukaan.Icon(Path(__file__).resolve().parent / "foo.png")
     window.icon = icon
     assert window.icon is icon
+
+
+@with_app_context
+def test_window_frame_is_fetched_once(app, window):
+    window.size = (300, 200)
+    update()
+
+    with profiling.profile() as profile:
+        assert window.size == (300, 200)
+        assert window.width == 300
+        assert window.height == 200
+        window.x
+        window.y
+
+    assert profile.snapshot()["::tukaan::geometry"].count == 1
+
+
+@with_app_context
+def test_widget_geometry_snapshot(app, window):
+    label = tukaan.Label(window, text="Text")
+    label.grid()
+
+    snapshot = label.geometry_snapshot()
+    assert snapshot.mapped
+    assert label.bbox == (
+        snapshot.abs_x,
+        snapshot.abs_y,
+        snapshot.requested_width,
+        snapshot.requested_height,
+    )
+
+
+@with_app_context
+def test_window_on_resize_is_debounced(app, window):
+    sizes = []
+    window.on_resize(sizes.append, debounce_ms=0)
+
+    window.size = (250, 150)
+    window.size = (300, 200)
+    update()
+
+    assert sizes == [(300, 200)]
+
+    window.on_resize(None)
+    window.size = (350, 250)
+    update()
+
+    assert sizes == [(300, 200)]
+
+
+@with_app_context
+def test_window_on_resize_ignores_children(app, window):
+    sizes = []
+    label = tukaan.Label(window)
+    label.grid()
+    update()
+
+    # A child that has the window's tag gets the window's <Configure> binding
+    Tcl.eval(None, f"bindtags {label._name} [linsert [bindtags {label._name}] 1 {window._name}]")
+    window.on_resize(sizes.append, debounce_ms=0)
+    Tcl.call(None, "event", "generate", label, "<Configure>", "-width", 10, "-height", 10)
+    update()
+
+    window.on_resize(None)
+    assert sizes == []
+
+
+@with_app_context
+def test_geometry_snapshot_is_fresh_when_configure_breaks(app, window):
+    label = tukaan.Label(window, text="Text")
+    label.grid()
+    label.bind("<Configure>", lambda: False)  # Stops the event before the `all` tag
+    update()
+
+    width = label.geometry_snapshot().width
+    label.text = "Some much longer text than before"
+    update()
+
+    assert label.geometry_snapshot().width > width
+    label.unbind("<Configure>")
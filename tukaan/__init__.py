@@ -4,6 +4,7 @@ __author__ = "rdbende"
 __license__ = "MIT"
 __version__ = "0.2.1"
 
+from ._builder import build
 from ._events import KeySeq
 from ._images import Icon, IconFactory, Image
 from ._misc import CursorFile
@@ -17,7 +18,7 @@ from .fonts.font import Font, font
 from .fonts.fontfile import FontFile, OpenTypeFont, TrueTypeCollection, TrueTypeFont
 from .screen import Screen, ScreenDistance, cm, inch, mm
 from .theming import AquaTheme, ClamTheme, KolorScheme, LookAndFeel, NativeTheme, Theme, Win32Theme
-from .timeouts import Timeout, Timer
+from .timeouts import Task, Timeout, Timer, sleep
 from .toplevels.main_window import MainWindow
 from .toplevels.window import Window
 from .widgets.button import Button
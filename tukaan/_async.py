@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import traceback
+from typing import Any, Coroutine
+
+import _tkinter as tk
+
+from tukaan._tcl import Tcl, TclCallback
+from tukaan.timeouts import timer_wheel
+
+_IO_POLL_MS = 5
+
+
+class AsyncioBridge:
+    """
+    Run an asyncio event loop inside the Tk event loop.
+
+    Tk waits for events, and the asyncio loop's selector is registered as a
+    Tcl file handler, so I/O readiness (including `call_soon_threadsafe`)
+    wakes up Tk. After each asyncio iteration, the next asyncio timer is
+    mapped onto a single `after` timer, so the process sleeps while idle.
+
+    Tukaan's own timers are armed as asyncio timers meanwhile, so they share
+    that single `after` too.
+
+    Only loops based on :class:`asyncio.BaseEventLoop` are supported, as their
+    ready queue and timers are looked at directly. If the loop has no selector
+    file descriptor (like the proactor loop on Windows), I/O can't wake up Tk,
+    so it's polled every 5ms while there are pending tasks. With no tasks, the
+    process still sleeps.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        if loop is not None and not isinstance(loop, asyncio.BaseEventLoop):
+            raise TypeError(
+                f"only loops based on asyncio.BaseEventLoop can run inside Tk, got {loop!r}"
+            )
+
+        self.loop = loop or asyncio.new_event_loop()
+        self._after_id: str | None = None
+        self._after_command = TclCallback(self._run_once)
+        self._selector_fd: int | None = None
+
+        selector = getattr(self.loop, "_selector", None)
+        if selector is not None and hasattr(Tcl._interp, "createfilehandler"):
+            try:
+                self._selector_fd = selector.fileno()  # epoll, kqueue and devpoll have one
+            except AttributeError:
+                pass
+
+        if self._selector_fd is not None:
+            Tcl._interp.createfilehandler(self._selector_fd, tk.READABLE, self._on_readable)  # type: ignore
+
+        self._previous_runner = TclCallback._coroutine_runner
+        TclCallback._coroutine_runner = self.create_task
+        asyncio.set_event_loop(self.loop)
+        timer_wheel.use_loop(self.loop, self._on_timer_armed)
+        self._schedule(0)
+
+    def create_task(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        task = self.loop.create_task(coro)
+        task.add_done_callback(_report_exception)
+        self._schedule(0)
+        return task
+
+    def _on_readable(self, *_: Any) -> None:
+        self._run_once()
+
+    def _on_timer_armed(self) -> None:
+        if not self.loop.is_running():
+            # Armed from a Tcl callback, so the `after` has to be moved, if the timer is earlier
+            self._schedule(self._next_timeout())
+
+    def _run_once(self) -> None:
+        self._after_id = None
+        if self.loop.is_running():
+            # Tcl processed events from inside a coroutine; the outer iteration reschedules
+            return
+
+        Tcl._dirty = True
+        # With the stop flag set, `run_forever` runs a single iteration, without blocking
+        self.loop.stop()
+        self.loop.run_forever()
+
+        self._schedule(self._next_timeout())
+
+    def _next_timeout(self) -> int | None:
+        loop: Any = self.loop  # A BaseEventLoop, checked in __init__
+        if loop._ready:
+            return 0
+
+        timeout = None
+        if loop._scheduled:
+            delay = loop._scheduled[0].when() - loop.time()
+            timeout = max(0, math.ceil(delay * 1000))
+
+        if self._selector_fd is None and asyncio.all_tasks(loop):
+            # I/O readiness can't wake up Tk without a file handler, so it's
+            # polled, but only while there's a task that might be waiting for it
+            timeout = _IO_POLL_MS if timeout is None else min(timeout, _IO_POLL_MS)
+
+        return timeout
+
+    def _schedule(self, timeout: int | None) -> None:
+        if self._after_id is not None:
+            Tcl._interp.call("after", "cancel", self._after_id)  # type: ignore
+            self._after_id = None
+
+        if timeout is not None:
+            self._after_id = Tcl._interp.call(  # type: ignore
+                "after", timeout, self._after_command._name
+            )
+
+    def close(self) -> None:
+        timer_wheel.use_loop(None)
+        self._schedule(None)
+        self._after_command.dispose()
+
+        if self._selector_fd is not None:
+            Tcl._interp.deletefilehandler(self._selector_fd)  # type: ignore
+
+        TclCallback._coroutine_runner = self._previous_runner
+
+        try:
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            self.loop.close()
+
+
+def _report_exception(task: asyncio.Task) -> None:
+    if task.cancelled():
+        return
+
+    exc = task.exception()
+    if exc is None:
+        return
+
+    print("Exception in Tukaan coroutine:")
+    print("".join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
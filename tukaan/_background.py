@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import inspect
+import threading
+import traceback
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Callable
+
+from tukaan._dispatch import Dispatcher
+
+
+class BackgroundTask:
+    """
+    A function running in a thread or process pool.
+
+    The progress, done and error callbacks are called on the GUI thread.
+    Progress updates are merged until the dispatcher's queue is drained next
+    time, and only the latest value is delivered then. This isn't tied to
+    frames, it happens once per wakeup of the event loop by the dispatcher.
+    """
+
+    future: Future
+
+    def __init__(self, dispatcher: Dispatcher) -> None:
+        self.progress: float = 0.0
+
+        self._dispatcher = dispatcher
+        self._lock = threading.Lock()
+        self._latest_progress: float | None = None
+        self._progress_callbacks: list[Callable[[float], Any]] = []
+        self._done_callbacks: list[Callable[[Any], Any]] = []
+        self._error_callbacks: list[Callable[[BaseException], Any]] = []
+
+    def _attach(self, future: Future) -> None:
+        self.future = future
+        future.add_done_callback(lambda _: self._dispatcher.submit(self._finish))
+
+    def __repr__(self) -> str:
+        state = "done" if self.future.done() else f"progress={self.progress!r}"
+        return f"<tukaan.BackgroundTask: {state}>"
+
+    def report_progress(self, fraction: float) -> None:
+        """Report progress between 0 and 1. Can be called from any thread."""
+        with self._lock:
+            pending = self._latest_progress is not None
+            self._latest_progress = fraction
+
+        if not pending:
+            self._dispatcher.submit(self._deliver_progress)
+
+    def _deliver_progress(self) -> None:
+        with self._lock:
+            fraction, self._latest_progress = self._latest_progress, None
+
+        if fraction is None or self.future.done():
+            return
+
+        self.progress = fraction
+        for callback in self._progress_callbacks:
+            callback(fraction)
+
+    def _finish(self) -> None:
+        if self.future.cancelled():
+            return
+
+        exc = self.future.exception()
+        if exc is not None:
+            if not self._error_callbacks:
+                print("Exception in Tukaan background task:")
+                print("".join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
+            for error_callback in self._error_callbacks:
+                error_callback(exc)
+            return
+
+        self.progress = 1.0
+        result = self.future.result()
+        for callback in self._done_callbacks:
+            callback(result)
+
+    def add_progress_callback(self, callback: Callable[[float], Any]) -> None:
+        self._progress_callbacks.append(callback)
+
+    def add_done_callback(self, callback: Callable[[Any], Any]) -> None:
+        """Call `callback` with the result of the task. Called immediately, if the task is done."""
+        if self.future.done() and not self.future.cancelled():
+            if self.future.exception() is None:
+                callback(self.future.result())
+        else:
+            self._done_callbacks.append(callback)
+
+    def add_error_callback(self, callback: Callable[[BaseException], Any]) -> None:
+        """
+        Call `callback` with the exception, if the task fails. Called immediately,
+        if it has already failed. Without error callbacks, the traceback is printed.
+        """
+        if self.future.done() and not self.future.cancelled():
+            exc = self.future.exception()
+            if exc is not None:
+                callback(exc)
+        else:
+            self._error_callbacks.append(callback)
+
+    def cancel(self) -> bool:
+        return self.future.cancel()
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def result(self, timeout: float | None = None) -> Any:
+        return self.future.result(timeout)
+
+
+def _accepts_progress(func: Callable[..., Any]) -> bool:
+    try:
+        return "progress" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def run_in_background(
+    executor: Executor,
+    dispatcher: Dispatcher,
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> BackgroundTask:
+    task = BackgroundTask(dispatcher)
+
+    # The reporter can't be sent to another process
+    if _accepts_progress(func) and not isinstance(executor, ProcessPoolExecutor):
+        kwargs = {**kwargs, "progress": task.report_progress}
+
+    task._attach(executor.submit(func, *args, **kwargs))
+    return task
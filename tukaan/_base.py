@@ -6,13 +6,13 @@ from typing import Any, Callable
 
 from libtukaan import Xcursor
 
-from tukaan._collect import commands, widgets
-from tukaan._events import BindingsMixin
+from tukaan._collect import widgets
+from tukaan._events import BindingsMixin, release_bindings
 from tukaan._layout import ContainerGrid, Geometry, Grid, Position, ToplevelGrid
 from tukaan._misc import CursorFile
 from tukaan._mixins import GeometryMixin, VisibilityMixin, WidgetMixin
-from tukaan._props import cget, config
-from tukaan._tcl import Tcl
+from tukaan._props import cget, config, drop_option_cache, fill_option_cache
+from tukaan._tcl import Tcl, TclCallback
 from tukaan._utils import count
 from tukaan.enums import Cursor, LegacyX11Cursor
 from tukaan.widgets.tooltip import ToolTipProvider
@@ -25,6 +25,22 @@ def generate_pathname(widget: TkWidget, parent: TkWidget) -> str:
     return ".".join((parent._name, f"{klass.__name__.lower()}_{count}"))
 
 
+def _find_descriptor(klass: type, name: str) -> Any:
+    for base in klass.__mro__:
+        if name in base.__dict__:
+            return base.__dict__[name]
+    return None
+
+
+def release_commands(widget: TkWidget) -> None:
+    """Release the Tcl commands owned by a widget and its children."""
+    TclCallback.unregister(widget)
+    release_bindings(widget)
+
+    for child in widget._children.values():
+        release_commands(child)
+
+
 class Container:
     ...
 
@@ -42,8 +58,8 @@ class XScrollable:
         Tcl.call(None, self, "xview", *args)
 
     @property
-    def on_xscroll(self) -> Callable[..., Any]:
-        return commands[cget(self, str, "-xscrollcommand")]
+    def on_xscroll(self) -> Callable[..., Any] | None:
+        return TclCallback.lookup(cget(self, str, "-xscrollcommand"))
 
     @on_xscroll.setter
     def on_xscroll(self, value: Callable[..., Any]) -> None:
@@ -55,8 +71,8 @@ class YScrollable:
         Tcl.call(None, self, "yview", *args)
 
     @property
-    def on_yscroll(self) -> Callable[..., Any]:
-        return commands[cget(self, str, "-yscrollcommand")]
+    def on_yscroll(self) -> Callable[..., Any] | None:
+        return TclCallback.lookup(cget(self, str, "-yscrollcommand"))
 
     @on_yscroll.setter
     def on_yscroll(self, value: Callable[..., Any]) -> None:
@@ -85,6 +101,10 @@ class ToplevelBase(TkWidget, Container):
 
 
 class WidgetBase(TkWidget, GeometryMixin):
+    cache_options_by_default = False
+    _option_cache: dict[str, Any] | None = None
+    _decoded_options: dict[Any, Any] | None = None
+
     def __init__(
         self,
         parent: TkWidget,
@@ -104,7 +124,13 @@ class WidgetBase(TkWidget, GeometryMixin):
         self.geometry = Geometry(self)
         self.position = Position(self)
 
+        for key, value in kwargs.items():
+            if callable(value):
+                kwargs[key] = TclCallback.register(self, key, value)
+
         Tcl.call(None, self._tcl_class, self._name, *Tcl.to_tcl_args(**kwargs))
+        if self.cache_options_by_default:
+            fill_option_cache(self)
 
         self._xcursor = None
         if cursor:
@@ -117,10 +143,54 @@ class WidgetBase(TkWidget, GeometryMixin):
         Xcursor.undefine_cursors(Tcl.eval({str}, f"winfo children {self._lm_path}"))
         Xcursor.undefine_cursors({self._lm_path})
         Tcl.call(None, "destroy", self._name)
+        release_commands(self)
 
         del self.parent._children[self._name]
         del widgets[self._name]
 
+    def configure(self, **properties: Any) -> None:
+        """
+        Set several properties at once. Properties that correspond to a Tcl
+        option are sent in a single configure call, and the rest in the same batch.
+        The property names are validated before anything is changed.
+        """
+        options: dict[str, Any] = {}
+        others: dict[str, Any] = {}
+
+        for name, value in properties.items():
+            descriptor = _find_descriptor(type(self), name)
+            if hasattr(descriptor, "to_option"):
+                option, option_value = descriptor.to_option(value)
+                options[option] = option_value
+            elif getattr(descriptor, "fset", None) is not None or (
+                not isinstance(descriptor, property) and hasattr(descriptor, "__set__")
+            ):
+                others[name] = value
+            else:
+                raise AttributeError(f"{type(self).__name__!r} has no settable property {name!r}")
+
+        with Tcl.batch():
+            if options:
+                config(self, **options)
+            for name, value in others.items():
+                setattr(self, name, value)
+
+    @property
+    def cache_options(self) -> bool:
+        """
+        Get or set whether this widget mirrors its options on the Python side,
+        so reading them doesn't call Tcl. Set `cache_options_by_default` on a
+        widget class to enable it for every new widget of that class.
+        """
+        return self._option_cache is not None
+
+    @cache_options.setter
+    def cache_options(self, value: bool) -> None:
+        if value:
+            fill_option_cache(self)
+        else:
+            drop_option_cache(self)
+
     @property
     def cursor(self) -> Cursor | LegacyX11Cursor | CursorFile:
         if self._xcursor is not None:
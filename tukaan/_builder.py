@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict
+
+from tukaan._tcl import Tcl
+
+if TYPE_CHECKING:
+    from tukaan._base import TkWidget
+
+WidgetSpec = Dict[str, Any]
+"""
+A dict describing a widget:
+
+- `type`: the widget class (required)
+- `options`: keyword arguments for the widget's constructor
+- `grid`: keyword arguments for `widget.grid()`. The widget isn't placed without it.
+- `children`: a list of specs for the widgets inside a container
+- `name`: the key of the widget in the dict returned by :func:`build`
+"""
+
+
+def _build(parent: TkWidget, specs: list[WidgetSpec], named: dict[str, TkWidget]) -> None:
+    for spec in specs:
+        try:
+            widget_class = spec["type"]
+        except KeyError:
+            raise ValueError(f"widget spec has no type: {spec!r}") from None
+
+        widget = widget_class(parent, **spec.get("options", {}))
+
+        if "grid" in spec:
+            widget.grid(**spec["grid"])
+
+        if "name" in spec:
+            named[spec["name"]] = widget
+
+        _build(widget, spec.get("children", []), named)
+
+
+def build(parent: TkWidget, spec: WidgetSpec | list[WidgetSpec]) -> dict[str, TkWidget]:
+    """
+    Create a tree of widgets, and place them on the grid.
+
+    Creating the widgets, their options, and their grid placement is sent to
+    Tcl as a single batch, instead of a round-trip for each widget.
+    Returns the widgets that have a `name` in their spec.
+    """
+    named: dict[str, TkWidget] = {}
+
+    with Tcl.batch():
+        _build(parent, spec if isinstance(spec, list) else [spec], named)
+
+    return named
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import collections
-from typing import TYPE_CHECKING, Any, Callable, DefaultDict, Iterator
+from typing import TYPE_CHECKING, Any, DefaultDict, Iterator
 
 from tukaan._utils import count
 
@@ -13,7 +13,6 @@ if TYPE_CHECKING:
 
 counter: DefaultDict[Any, Iterator[int]] = collections.defaultdict(count)
 
-commands: dict[str, Callable[..., Any]] = {}
 fonts: dict[str, Font] = {}
 images: dict[str, Icon | Pillow2Tcl] = {}
 variables: dict[str, ControlVariable[Any]] = {}
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import collections
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable
+
+import _tkinter as tk
+
+from tukaan._tcl import Tcl
+
+
+class Dispatcher:
+    """
+    A thread-safe queue of calls, that are run by the event loop on the Tcl thread.
+
+    Worker threads wake up the event loop by writing to a pipe, that's watched
+    by a Tcl file handler. Where Tcl can't watch pipes (on Windows), the wakeup
+    is scheduled with an `after 0` sent to the Tcl thread instead.
+    Submissions made before the queue is drained only wake the loop once.
+    """
+
+    def __init__(self) -> None:
+        self._queue: collections.deque[tuple[Future, Callable[..., Any], tuple, dict]] = (
+            collections.deque()
+        )
+        self._lock = threading.Lock()
+        self._pending = False
+        self._command_name = f"tukaan_dispatch_{id(self)}"
+
+        Tcl._interp.createcommand(self._command_name, self._drain)  # type: ignore
+
+        self._read_fd = self._write_fd = -1
+        if hasattr(Tcl._interp, "createfilehandler"):
+            self._read_fd, self._write_fd = os.pipe()
+            os.set_blocking(self._read_fd, False)
+            os.set_blocking(self._write_fd, False)
+            Tcl._interp.createfilehandler(self._read_fd, tk.READABLE, self._on_readable)  # type: ignore
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Schedule `func` to be called on the Tcl thread, and return a future for its result."""
+        future: Future = Future()
+
+        with self._lock:
+            self._queue.append((future, func, args, kwargs))
+            if self._pending:
+                return future
+            self._pending = True
+
+        self._wake_up()
+        return future
+
+    def _wake_up(self) -> None:
+        if self._write_fd != -1:
+            try:
+                os.write(self._write_fd, b"\0")
+            except BlockingIOError:
+                pass  # The pipe is full, so the loop will wake up anyway
+        else:
+            # From other threads, _tkinter sends the call to the Tcl thread, and waits for it
+            Tcl._interp.call("after", "0", self._command_name)  # type: ignore
+
+    def _on_readable(self, *_: Any) -> None:
+        try:
+            while os.read(self._read_fd, 512):
+                pass
+        except BlockingIOError:
+            pass
+
+        self._drain()
+
+    def _drain(self, *_: Any) -> None:
+        Tcl._dirty = True
+        with self._lock:
+            items = list(self._queue)
+            self._queue.clear()
+            self._pending = False
+
+        for future, func, args, kwargs in items:
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def close(self) -> None:
+        """Stop watching the pipe, and cancel the calls that haven't been run yet."""
+        if self._read_fd != -1:
+            Tcl._interp.deletefilehandler(self._read_fd)  # type: ignore
+            os.close(self._read_fd)
+            os.close(self._write_fd)
+            self._read_fd = self._write_fd = -1
+
+        Tcl._interp.deletecommand(self._command_name)  # type: ignore
+
+        with self._lock:
+            items = list(self._queue)
+            self._queue.clear()
+
+        for future, *_ in items:
+            future.cancel()
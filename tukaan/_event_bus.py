@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import traceback
+import weakref
+from typing import Any, Callable, Union
+
+from tukaan._events import VirtualEvent, _virtual_event_data_container
+from tukaan._tcl import Tcl, TclCallback
+
+_Subscriber = Union[Callable[[], Any], "weakref.WeakMethod[Callable[..., Any]]"]
+
+
+class EventBus:
+    """
+    Publish virtual events with a payload to subscribers in Python.
+
+    Events are delivered to the subscribers directly, without going through
+    Tcl. If an event has to be ordered with the user input that's already
+    waiting in the queue, it can be sent through Tk with `via_tk`.
+
+    Bound methods are referenced weakly, so subscribing doesn't keep their
+    object alive. They're unsubscribed when the object is garbage collected.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[str, tuple[_Subscriber, ...]] = {}
+        self._command: TclCallback | None = None
+        self._bound: set[str] = set()
+
+    def __repr__(self) -> str:
+        return f"<tukaan.EventBus: {len(self._subscribers)} events>"
+
+    def subscribe(self, name: str, callback: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        """Call `callback` with the payload, when `name` is published."""
+        if not VirtualEvent._match(name):
+            raise ValueError(f"invalid virtual event name: {name!r}")
+
+        subscriber: _Subscriber
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            subscriber = weakref.WeakMethod(callback, lambda ref: self._remove(name, ref))
+        else:
+            subscriber = lambda: callback  # noqa: E731
+
+        # Publishing iterates over the tuple, so it doesn't need to make a copy
+        self._subscribers[name] = self._subscribers.get(name, ()) + (subscriber,)
+
+        if self._command is not None and name not in self._bound:
+            self._bind(name)
+
+        return callback
+
+    def unsubscribe(self, name: str, callback: Callable[[Any], Any]) -> None:
+        for subscriber in self._subscribers.get(name, ()):
+            if subscriber() == callback:
+                self._remove(name, subscriber)
+                return
+
+    def _remove(self, name: str, subscriber: _Subscriber) -> None:
+        subscribers = self._subscribers.get(name, ())
+        remaining = tuple(item for item in subscribers if item is not subscriber)
+        if remaining:
+            self._subscribers[name] = remaining
+        else:
+            self._subscribers.pop(name, None)
+
+    def publish(self, name: str, data: object = None, *, via_tk: bool = False) -> None:
+        """
+        Deliver `data` to the subscribers of `name`.
+
+        With `via_tk`, the event is put at the end of the Tk event queue,
+        so it's delivered after the input events that are already queued.
+        """
+        if not via_tk:
+            self._deliver(name, data)
+            return
+
+        if self._command is None:
+            self._command = TclCallback(self._deliver_from_tk)
+            for subscribed_name in self._subscribers:
+                self._bind(subscribed_name)
+
+        key = "" if data is None else _virtual_event_data_container.add(data)
+        Tcl.call(None, "event", "generate", ".", name, "-data", key, "-when", "tail")
+
+    def _bind(self, name: str) -> None:
+        assert self._command is not None
+        Tcl.call(None, "bind", ".", name, f"+{self._command._name} {name} %d")
+        self._bound.add(name)
+
+    def _deliver_from_tk(self, name: str, key: str) -> None:
+        self._deliver(name, _virtual_event_data_container.get(key) if key else None)
+
+    def _deliver(self, name: str, data: object) -> None:
+        for subscriber in self._subscribers.get(name, ()):
+            callback = subscriber()
+            if callback is None:
+                continue
+
+            try:
+                callback(data)
+            except Exception:
+                print("Exception in Tukaan event bus subscriber:")
+                print(traceback.format_exc())
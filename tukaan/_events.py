@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import collections
+import contextlib
 import re
+import weakref
 from functools import partial
-from typing import Any, Callable, Union
-from uuid import uuid4
+from typing import Any, Callable, Iterable, Union
 
 from tukaan._collect import widgets
 from tukaan._keysyms import keysym_aliases, reversed_keysym_aliases
 from tukaan._system import Platform
-from tukaan._tcl import Tcl
-from tukaan._utils import reversed_dict
+from tukaan._tcl import Tcl, TclCallback
+from tukaan._utils import count, reversed_dict
 from tukaan.enums import EventQueue
 
 if Platform.os == "macOS":
@@ -22,6 +24,8 @@ if Platform.os == "macOS":
         "Shift": "Shift",
     }
     SHORTCUT_SEP = ""
+    # Bits of the event state, that keyboard shortcuts can consist of
+    SHORTCUT_STATE_BITS = {1 << 0: "Shift", 1 << 2: "Control", 1 << 3: "Command", 1 << 4: "Option"}
 else:
     BUTTON_NUMS = {"left": 1, "middle": 2, "right": 3}
     ACCEL_MODIFIER_ORDER = {"Control": "Ctrl", "Control": "Ctrl", "Alt": "Alt", "Shift": "Shift"}
@@ -32,6 +36,11 @@ else:
         "Shift": "Shift",
     }
     SHORTCUT_SEP = "+"
+    SHORTCUT_STATE_BITS = {
+        1 << 0: "Shift",
+        1 << 2: "Control",
+        (1 << 17 if Platform.os == "Windows" else 1 << 3): "Alt",
+    }
 
 MODIFIERS = {
     1 << 12: "MouseWheel:Down",
@@ -51,55 +60,94 @@ MODIFIERS = {
 
 
 class DataContainer:
-    _container_dict: dict[str, Any] = {}
+    """
+    Holds the payloads of virtual events, until the handlers fetch them.
+
+    Every handler of an event gets the payload, so it isn't removed on the
+    first access. Instead, only the last `maxlen` payloads are kept. Objects
+    that support weak references can still be fetched after they were pushed
+    out, as long as they are alive.
+    """
+
+    def __init__(self, maxlen: int = 1024) -> None:
+        self.maxlen = maxlen
+        self._items: collections.OrderedDict[str, Any] = collections.OrderedDict()
+        self._weak_items: weakref.WeakValueDictionary[str, Any] = weakref.WeakValueDictionary()
+        self._keys = count()
+
+    def __len__(self) -> int:
+        return len(self._items)
 
     def add(self, value: object) -> str:
-        key = str(uuid4())
-        self._container_dict[key] = value
-        return key
+        key = str(next(self._keys))
+        self._items[key] = value
+        with contextlib.suppress(TypeError):
+            self._weak_items[key] = value
+
+        if len(self._items) > self.maxlen:
+            self._items.popitem(last=False)
 
-    def pop(self, key: str) -> Any:
-        return self._container_dict.pop(key, None)
+        return key
 
-    def __getitem__(self, key: str) -> Any:
-        return self._container_dict[key]
+    def get(self, key: str) -> Any:
+        try:
+            return self._items[key]
+        except KeyError:
+            return self._weak_items.get(key)
 
 
 _virtual_event_data_container = DataContainer()
 
 
+_MODIFIER_MASK = (1 << 13) - 1
+_modifier_sets: dict[int, frozenset[str]] = {}
+_BUTTON_NAMES = reversed_dict(BUTTON_NUMS)
+
+
+def _decode_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return int(Tcl._interp.getdouble(value))  # type: ignore
+
+
+def _decode_modifiers(value: Any) -> frozenset[str]:
+    """
+    Look up the set of modifiers for a state bitmask. The sets are built the
+    first time a state occurs, so it's a dict lookup for every other event.
+    """
+    state = _decode_int(value) & _MODIFIER_MASK
+
+    try:
+        return _modifier_sets[state]
+    except KeyError:
+        modifiers = frozenset(name for bit, name in MODIFIERS.items() if state & bit)
+        _modifier_sets[state] = modifiers
+        return modifiers
+
+
+def _decode_button(value: Any) -> str | None:
+    return _BUTTON_NAMES.get(_decode_int(value))
+
+
+def _decode_keysym(value: str) -> str:
+    return keysym_aliases.get(value, value)
+
+
+def _decode_virtual_data(value: str) -> Any:
+    return _virtual_event_data_container.get(value) if value else None
+
+
 class Event:
-    _sequence_aliases: dict[str, str]
-    _ignored_values: tuple[object, ...]
-    _relevant_attrs: tuple[str, ...]
-    _result: str | bool = True
-    _substitutions: dict[str, tuple[str, type]] = {
-        "button": ("%b", int),
-        "modifiers": ("%s", int),
-        "keycode": ("%k", int),
-        "rel_x": (r"%x", int),
-        "rel_y": (r"%y", int),
-        "char": ("%A", str),
-        "delta": ("%D", float),
-        "keysymbol": ("%K", str),
-        "widget": (r"%W", str),
-        "abs_x": (r"%X", int),
-        "abs_y": (r"%Y", int),
-    }
-    _order: tuple[str, ...] = tuple(_substitutions.keys())
-    # FIXME: _order must be updated when subclass overwrites _substitutions, this makes the code fragile
-    # Tukaan requires python 3.7+, so we don't need an OrderedDict
-    sequence: str
+    __slots__ = ("sequence", "widget", "_result")
 
-    def __init__(self, *args) -> None:
-        for item in self._relevant_attrs:
-            value = args[self._order.index(item)]
-            if value != "??":
-                value = Tcl.from_(self._substitutions[item][1], value)
-            else:
-                value = None
+    _sequence_aliases: dict[str, str]
+    _ignored_values: tuple[object, ...] = ()
+    _relevant_attrs: tuple[str, ...] = ()
+    _fields: dict[str, tuple[str, Callable[[Any], Any]]] = {}
 
-            setattr(self, item, value)
+    sequence: str
+    widget: Any
 
     def __repr__(self) -> str:
         pairs = []
@@ -119,15 +167,10 @@ class Event:
 
         raise ValueError(f"invalid binding sequence: {sequence}")
 
-    def _get_modifiers(self, value: int) -> set[str]:
-        result = []
-
-        for modifier_value in MODIFIERS:
-            if value >= modifier_value:
-                value -= modifier_value
-                result.append(MODIFIERS[modifier_value])
-
-        return set(result)
+    @classmethod
+    def _get_fields(cls, tk_sequence: str) -> dict[str, tuple[str, Callable[[Any], Any]]]:
+        """Return the attributes that Tk can fill in for this sequence, with their substitution."""
+        return cls._fields
 
     @classmethod
     def _match(cls, sequence: str) -> bool:
@@ -142,9 +185,79 @@ class Event:
         return self._result
 
 
+class _EventDecoder:
+    """
+    Creates event objects for a binding sequence.
+
+    Everything that doesn't depend on the actual event is worked out once, when
+    binding: Tk only substitutes the fields the event class uses, and the
+    values are stored directly into the slots of the event object.
+    """
+
+    __slots__ = (
+        "event_class",
+        "tk_sequences",
+        "substitutions",
+        "condition",
+        "_new",
+        "_sequence",
+        "_setters",
+        "_defaults",
+    )
+
+    def __init__(
+        self, event_class: type[Event], sequence: str, tk_sequences: tuple[str, ...]
+    ) -> None:
+        fields = event_class._get_fields(tk_sequences[0])
+
+        # %W is always the last argument
+        self.substitutions = " ".join([code for code, _ in fields.values()] + ["%W"])
+
+        self.condition = ""
+        if "button" in fields and Tcl.windowing_system == "x11":
+            # Don't execute callback if the binding was <Mouse(Down|Up):Any>,
+            # and the button number is 4 or 5 (mouse wheel)
+            self.condition = "%b < 4"
+
+        self.event_class = event_class
+        self.tk_sequences = tk_sequences
+        self._new = partial(object.__new__, event_class)
+        self._sequence = sequence
+        self._setters = tuple(
+            (getattr(event_class, name).__set__, convert) for name, (_, convert) in fields.items()
+        )
+        self._defaults = tuple(
+            getattr(event_class, name).__set__
+            for name in event_class._relevant_attrs
+            if name not in fields
+        )
+
+    def __call__(self, args: tuple[str, ...]) -> Event:
+        event = self._new()
+
+        for (set_value, convert), value in zip(self._setters, args):
+            set_value(event, None if value == "??" else convert(value))
+
+        for set_value in self._defaults:
+            set_value(event, None)
+
+        event.sequence = self._sequence
+        event.widget = widgets.get(args[-1])
+        event._result = True
+        return event
+
+
 class KeyboardEvent(Event):
+    __slots__ = ("char", "modifiers", "keysymbol", "keycode")
+
     _ignored_values = (None, "", "??", -1, 0, (), set())
     _relevant_attrs = ("char", "modifiers", "keysymbol", "keycode")
+    _fields = {
+        "char": ("%A", str),
+        "modifiers": ("%s", _decode_modifiers),
+        "keysymbol": ("%K", _decode_keysym),
+        "keycode": ("%k", _decode_int),
+    }
     _regex = r"<Key(Down|Up):\((.*?)\)>"
 
     _sequence_aliases = {
@@ -154,21 +267,6 @@ class KeyboardEvent(Event):
         "<KeyUp>": "<KeyRelease>",
     }
 
-    def __init__(self, *args) -> None:
-        for item in self._relevant_attrs:
-            value = args[self._order.index(item)]
-            if value != "??":
-                value = Tcl.from_(self._substitutions[item][1], value)
-            else:
-                value = None
-
-            if item == "keysymbol" and value in keysym_aliases:
-                value = keysym_aliases[value]
-            elif item == "modifiers":
-                value = self._get_modifiers(value)
-
-            setattr(self, item, value)
-
     @classmethod
     def _match(cls, sequence: str) -> bool:
         return sequence in cls._sequence_aliases or bool(re.match(cls._regex, sequence))
@@ -211,8 +309,18 @@ class KeyboardEvent(Event):
 
 
 class MouseEvent(Event):
+    __slots__ = ("button", "modifiers", "abs_x", "abs_y", "rel_x", "rel_y")
+
     _ignored_values = (None, "??", set())
     _relevant_attrs = ("button", "modifiers", "abs_x", "abs_y", "rel_x", "rel_y")
+    _fields = {
+        "button": ("%b", _decode_button),
+        "modifiers": ("%s", _decode_modifiers),
+        "abs_x": ("%X", _decode_int),
+        "abs_y": ("%Y", _decode_int),
+        "rel_x": ("%x", _decode_int),
+        "rel_y": ("%y", _decode_int),
+    }
 
     _sequence_aliases = {
         # button press
@@ -249,20 +357,13 @@ class MouseEvent(Event):
         "<MouseMotion>": "<Motion>",
     }
 
-    def __init__(self, *args) -> None:
-        for item in self._relevant_attrs:
-            value = args[self._order.index(item)]
-            if value != "??":
-                value = Tcl.from_(self._substitutions[item][1], value)
-            else:
-                value = None
-
-            if value and item == "button":
-                value = reversed_dict(BUTTON_NUMS).get(value)
-            elif item == "modifiers":
-                value = self._get_modifiers(value)
+    @classmethod
+    def _get_fields(cls, tk_sequence: str) -> dict[str, tuple[str, Callable[[Any], Any]]]:
+        if "ButtonPress" in tk_sequence or "ButtonRelease" in tk_sequence:
+            return cls._fields
 
-            setattr(self, item, value)
+        # Tk has no button number for motion and crossing events
+        return {name: field for name, field in cls._fields.items() if name != "button"}
 
     @classmethod
     def _parse(cls, sequence: str) -> str:
@@ -270,18 +371,21 @@ class MouseEvent(Event):
 
 
 class ScrollEvent(Event):
+    __slots__ = ("delta", "modifiers")
+
     _ignored_values = (None, "??", set())
     _relevant_attrs = ("delta", "modifiers")
     _sequence_aliases = {}
 
-    def __init__(self, *args) -> None:
+    @classmethod
+    def _get_fields(cls, tk_sequence: str) -> dict[str, tuple[str, Callable[[Any], Any]]]:
         if Tcl.windowing_system == "x11":
-            num = Tcl.from_(int, args[self._order.index("button")])
-            self.delta = -1 if num == 4 else 1
+            # Scrolling is reported as presses of button 4 and 5
+            delta = ("[expr {%b == 4 ? -1 : 1}]", _decode_int)
         else:
-            self.delta = Tcl.from_(int, args[self._order.index("delta")])
+            delta = ("%D", _decode_int)
 
-        self.modifiers = self._get_modifiers(Tcl.from_(int, args[self._order.index("modifiers")]))
+        return {"delta": delta, "modifiers": ("%s", _decode_modifiers)}
 
     @classmethod
     def _match(cls, sequence: str) -> bool:
@@ -293,6 +397,8 @@ class ScrollEvent(Event):
 
 
 class StateEvent(Event):
+    __slots__ = ()
+
     _ignored_values = (None, "??", set())
     _relevant_attrs = ()
     _sequence_aliases = {
@@ -303,14 +409,11 @@ class StateEvent(Event):
 
 
 class VirtualEvent(Event):
-    _substitutions = {"data": ("%d", int), "widget": ("%W", str)}
-    _order = tuple(_substitutions.keys())
-    _sequence_aliases = {}
+    __slots__ = ("data",)
 
-    def __init__(self, *args) -> None:
-        data_key = Tcl.from_(str, args[0])
-
-        self.data = _virtual_event_data_container.pop(data_key) if data_key else None
+    _relevant_attrs = ("data",)
+    _fields = {"data": ("%d", _decode_virtual_data)}
+    _sequence_aliases = {}
 
     def __repr__(self) -> str:
         plus_str = "" if self.data is None else f"; data={self.data!r}"
@@ -330,27 +433,251 @@ _BindCallback = Union[
 ]
 
 
-def binding_wrapper(
-    widget, sequence: str, func: _BindCallback, event: type[Event], send: bool, *args: str
-) -> str | bool | None:
-    if (
-        Tcl.windowing_system == "x11"
-        and event is MouseEvent
-        and int(args[event._order.index("button")]) > 3
-    ):
-        # Don't execute callback if the binding was <Mouse(Down|Up):Any>,
-        # and the button number is 4 or 5 (mouse wheel)
+_COALESCE_PROC = """
+namespace eval ::tukaan {
+    variable coalesced
+    variable last_delivery
+}
+proc ::tukaan::coalesce {command id interval sum args} {
+    variable coalesced
+    if {[info exists coalesced($id)]} {
+        if {$sum} {
+            lset args 0 [expr {[lindex $coalesced($id) 0] + [lindex $args 0]}]
+        }
+        set coalesced($id) $args
         return
+    }
+    set coalesced($id) $args
+
+    set delay idle
+    if {$interval && [info exists ::tukaan::last_delivery($id)]} {
+        set wait [expr {$::tukaan::last_delivery($id) + $interval - [clock milliseconds]}]
+        if {$wait > 0} {
+            set delay $wait
+        }
+    }
+    after $delay [list ::tukaan::deliver_coalesced $command $id $interval]
+}
+proc ::tukaan::deliver_coalesced {command id interval} {
+    variable coalesced
+    if {![info exists coalesced($id)]} return
+    set values $coalesced($id)
+    unset coalesced($id)
+    if {$interval} {
+        set ::tukaan::last_delivery($id) [clock milliseconds]
+    }
+    $command $id {*}$values
+}
+"""
+
+_MODIFIER_BITS = reversed_dict(MODIFIERS)
+
+
+def _as_set(value: str | Iterable[str]) -> set[str]:
+    return {value} if isinstance(value, str) else set(value)
+
+
+def _keysyms_for(name: str) -> set[str]:
+    """Return the Tk keysyms, that are reported as `name` in a KeyboardEvent."""
+    result = {keysym for keysym, alias in keysym_aliases.items() if alias == name}
+    if name not in keysym_aliases:
+        result.add(name)
+    return result
+
+
+def _compile_predicate(decoder: _EventDecoder, when: dict[str, Any]) -> str:
+    """
+    Compile a `when` filter into a Tcl expression for the bind script.
+
+    `keysymbol` and `button` take a name or a collection of names, that the
+    event can have any of. `modifiers` takes modifier names, that all must be held.
+    """
+    fields = decoder.event_class._get_fields(decoder.tk_sequences[0])
+    conditions = []
+
+    for name, value in when.items():
+        if name not in fields or name not in ("keysymbol", "button", "modifiers"):
+            raise ValueError(f"can't filter {decoder._sequence} events by {name!r}")
+
+        if name == "keysymbol":
+            keysyms = set().union(*map(_keysyms_for, _as_set(value)))
+            conditions.append(f"{{%K}} in {{{' '.join(sorted(keysyms))}}}")
+        elif name == "button":
+            try:
+                numbers = sorted(BUTTON_NUMS[button] for button in _as_set(value))
+            except KeyError as e:
+                raise ValueError(f"invalid mouse button: {e.args[0]!r}") from None
+            conditions.append(f"%b in {{{' '.join(map(str, numbers))}}}")
+        else:
+            try:
+                mask = sum(_MODIFIER_BITS[modifier] for modifier in _as_set(value))
+            except KeyError as e:
+                raise ValueError(f"invalid modifier: {e.args[0]!r}") from None
+            conditions.append(f"(%s & {mask}) == {mask}")
+
+    return " && ".join(conditions)
+
+
+_compiled_sequences: dict[str, _EventDecoder] = {}
+
+
+def _compile_sequence(sequence: str) -> _EventDecoder:
+    """Parse a Tukaan sequence into the Tk sequences to bind to, and the decoder for them."""
+    try:
+        return _compiled_sequences[sequence]
+    except KeyError:
+        pass
+
+    if "MouseWheel" in sequence and Tcl.windowing_system == "x11":
+        names = [
+            sequence.replace("MouseWheel", "Button-4"),
+            sequence.replace("MouseWheel", "Button-5"),
+        ]
+    elif "Menu" in sequence and Platform.os == "Windows":
+        names = [sequence.replace("Menu", "App")]
+    else:
+        names = [sequence]
+
+    event_class = Event._get_event_class_for_sequence(names[0])
+    tk_sequences = tuple(event_class._parse(name) for name in names)
+
+    decoder = _compiled_sequences[sequence] = _EventDecoder(event_class, sequence, tk_sequences)
+    return decoder
+
+
+class _Bindings:
+    """
+    The Python side of all bindings.
+
+    Bind scripts call a single dispatcher command with the id of the binding,
+    so binding doesn't create a new Tcl command, and unbinding removes only
+    one entry from this table.
+
+    Coalesced bindings keep only the latest event in Tcl (summing the deltas
+    of scroll events), and the dispatcher is called with it once per frame,
+    or at most `max_rate` times per second.
+    """
+
+    def __init__(self) -> None:
+        self._callbacks: dict[int, tuple[_BindCallback, _EventDecoder | None]] = {}
+        self._owned: weakref.WeakKeyDictionary[Any, dict[str, list[int]]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._ids = count()
+        self._coalesced: set[int] = set()
+        self._command: TclCallback | None = None
+        self._interp: Any = None
+
+    @property
+    def command_name(self) -> str:
+        if self._command is None or self._interp is not Tcl._interp:
+            # The command lives in the interpreter of the current app
+            self._command = TclCallback(self._dispatch)
+            self._interp = Tcl._interp
+            Tcl.eval(None, _COALESCE_PROC)
+
+        return self._command._name
+
+    def add(
+        self,
+        owner: object,
+        decoder: _EventDecoder,
+        callback: _BindCallback,
+        send: bool,
+        replace: bool,
+        coalesce_ms: int | None = None,
+        condition: str = "",
+    ) -> tuple[int, str]:
+        """Add a binding, and return its id and the script that calls it."""
+        substitutions = decoder.substitutions if send else ""
+
+        binding_id = next(self._ids)
+        self._callbacks[binding_id] = (callback, decoder if send else None)
+
+        try:
+            slots = self._owned[owner]
+        except KeyError:
+            slots = self._owned[owner] = {}
+            weakref.finalize(owner, self._release_slots, self._callbacks, slots)
+
+        for tk_sequence in decoder.tk_sequences:
+            if replace:
+                for previous in slots.pop(tk_sequence, ()):
+                    self._callbacks.pop(previous, None)
+            slots.setdefault(tk_sequence, []).append(binding_id)
+
+        call = f"{self.command_name} {binding_id} "
+        if coalesce_ms is None:
+            script = f"if {{[{call}{substitutions}] == 0}} break"
+        else:
+            self._coalesced.add(binding_id)
+            sum_deltas = int(send and issubclass(decoder.event_class, ScrollEvent))
+            script = f"::tukaan::coalesce {call}{coalesce_ms} {sum_deltas} {substitutions}"
+
+        # The event is filtered in the bind script, so Python is called only if it matches
+        condition = " && ".join(filter(None, (decoder.condition, condition)))
+        if condition:
+            script = f"if {{{condition}}} {{{script}}}"
+
+        return binding_id, script
+
+    def remove(self, owner: object, tk_sequence: str, binding_id: int | None = None) -> None:
+        slots = self._owned.get(owner)
+        if not slots:
+            return
+
+        if binding_id is None:
+            ids = slots.pop(tk_sequence, [])
+        elif binding_id in slots.get(tk_sequence, ()):
+            slots[tk_sequence].remove(binding_id)
+            ids = [binding_id]
+        else:
+            return
+
+        for item in ids:
+            self._callbacks.pop(item, None)
+
+            if item in self._coalesced:
+                self._coalesced.discard(item)
+                Tcl.eval(
+                    None,
+                    f"unset -nocomplain ::tukaan::coalesced({item}) "
+                    + f"::tukaan::last_delivery({item})",
+                )
+
+    def release(self, owner: object) -> None:
+        slots = self._owned.pop(owner, None)
+        if slots:
+            self._release_slots(self._callbacks, slots)
+
+    @staticmethod
+    def _release_slots(callbacks: dict[int, Any], slots: dict[str, list[int]]) -> None:
+        for ids in slots.values():
+            for binding_id in ids:
+                callbacks.pop(binding_id, None)
+        slots.clear()
+
+    def _dispatch(self, binding_id: str, *args: str) -> str | bool | None:
+        try:
+            func, decoder = self._callbacks[int(binding_id)]
+        except KeyError:
+            return None  # Unbound, while the event was already being processed
+
+        if decoder is None:
+            return func()  # type: ignore
 
-    if not send:
-        return func()
+        sent_event = decoder(args)
+        result = func(sent_event)  # type: ignore
 
-    sent_event = event(*args)
-    sent_event.sequence = sequence
-    sent_event.widget = widgets.get(args[event._order.index("widget")])
-    result = func(sent_event)
+        return result if result is not None else sent_event._result
 
-    return result if result is not None else sent_event._result
+
+_bindings = _Bindings()
+
+
+def release_bindings(owner: object) -> None:
+    """Forget the callbacks bound to `owner`."""
+    _bindings.release(owner)
 
 
 class BindingsMixin:
@@ -359,39 +686,80 @@ class BindingsMixin:
     def bind(
         self,
         sequence: str,
-        callback: _BindCallback | None,
+        callback: _BindCallback | str | None,
         *,
         overwrite: bool = False,
         send: bool = False,
-    ) -> None:
+        coalesce: bool = False,
+        max_rate: float | None = None,
+        when: dict[str, Any] | None = None,
+    ) -> int | None:
+        """
+        Call `callback` when the event occurs, and return the id of the binding.
+        If `send` is True, the callback gets the event object as its argument.
+        A string is bound as a Tcl script.
+
+        With `coalesce`, events that arrive faster than the screen is redrawn
+        are dropped in Tcl, and only the latest one is delivered (scroll events
+        are delivered with their deltas summed). `max_rate` limits the number
+        of calls per second, and implies `coalesce`. The return value of a
+        coalesced callback can't stop other bindings from being executed.
+
+        `when` filters the events in Tcl, before calling into Python, for
+        example `when={"keysymbol": {"Enter", "Escape"}, "modifiers": {"Control"}}`.
+        """
         if isinstance(sequence, KeySeq):
             sequence = sequence.event_sequence
 
-        if "MouseWheel" in sequence and Tcl.windowing_system == "x11":
-            self.bind(
-                sequence.replace("MouseWheel", "Button-4"), callback, overwrite=overwrite, send=send
-            )
-            self.bind(
-                sequence.replace("MouseWheel", "Button-5"), callback, overwrite=overwrite, send=send
-            )
-            return
-        elif "Menu" in sequence and Platform.os == "Windows":
-            sequence = sequence.replace("Menu", "App")
+        if callback is None:
+            self.unbind(sequence)
+            return None
 
-        event = Event._get_event_class_for_sequence(sequence)
+        decoder = _compile_sequence(sequence)
+        name = self._wm_path if hasattr(self, "_wm_path") else self._name
 
-        if callable(callback):
-            cmd = Tcl.to(partial(binding_wrapper, self, sequence, callback, event, send))
-            subst_str = " ".join(item[0] for item in event._substitutions.values())
-            script_str = f"{'' if overwrite else '+'} if {{[{cmd} {subst_str}] == 0}} break"
-        else:
-            script_str = ""
+        if isinstance(callback, str):
+            for tk_sequence in decoder.tk_sequences:
+                if not callback.startswith("+"):
+                    _bindings.remove(self, tk_sequence)
+                Tcl.call(None, "bind", name, tk_sequence, callback)
+            return None
+
+        coalesce_ms = None
+        if max_rate is not None:
+            coalesce_ms = max(1, round(1000 / max_rate))
+        elif coalesce:
+            coalesce_ms = 0
+
+        condition = _compile_predicate(decoder, when) if when else ""
+        binding_id, script = _bindings.add(
+            self, decoder, callback, send, overwrite, coalesce_ms, condition
+        )
+        script_str = f"{'' if overwrite else '+'}{script}"
+
+        for tk_sequence in decoder.tk_sequences:
+            Tcl.call(None, "bind", name, tk_sequence, script_str)
+
+        return binding_id
+
+    def unbind(self, sequence: str, binding_id: int | None = None) -> None:
+        """Remove the binding with `binding_id`, or all bindings of the sequence."""
+        if isinstance(sequence, KeySeq):
+            sequence = sequence.event_sequence
 
         name = self._wm_path if hasattr(self, "_wm_path") else self._name
-        Tcl.call(None, "bind", name, event._parse(sequence), script_str)
 
-    def unbind(self, sequence: str) -> None:
-        self.bind(sequence, None)
+        for tk_sequence in _compile_sequence(sequence).tk_sequences:
+            _bindings.remove(self, tk_sequence, binding_id)
+
+            if binding_id is None:
+                Tcl.call(None, "bind", name, tk_sequence, "")
+                continue
+
+            marker = f"{_bindings.command_name} {binding_id} "
+            script = Tcl.call(str, "bind", name, tk_sequence)
+            lines = [line for line in script.split("\n") if marker not in line]
+            Tcl.call(None, "bind", name, tk_sequence, "\n".join(lines))
 
     def generate_event(self, sequence: str, data: object = None, queue: EventQueue = None) -> None:
         if not VirtualEvent._match(sequence):
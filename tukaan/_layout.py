@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Iterable, TypeVar
 
 from tukaan._tcl import Tcl
 from tukaan.enums import Align, Anchor
@@ -13,6 +13,12 @@ if TYPE_CHECKING:
 
 IntOrStr = TypeVar("IntOrStr", int, str)
 
+_decode_info = Tcl.compile_decoder({})
+# Layout info by widget path and manager. Anything that could change the layout
+# without going through a LayoutManager marks Tcl dirty, and that clears the cache on sync.
+_layout_info: dict[str, dict[str, dict[str, Any]]] = {}
+Tcl._sync_hooks.append(_layout_info.clear)
+
 
 class LayoutManager(ABC):
     _type: str
@@ -24,15 +30,28 @@ class LayoutManager(ABC):
     def __call__(self, *args: Any, **kwargs: Any) -> None:
         pass
 
+    def _info(self) -> dict[str, Any]:
+        Tcl.sync()
+        cache = _layout_info.setdefault(self._widget._name, {})
+        try:
+            return cache[self._type]
+        except KeyError:
+            info = cache[self._type] = Tcl.call(_decode_info, self._type, "info", self._widget)
+            return info
+
+    def _invalidate(self) -> None:
+        _layout_info.pop(self._widget._name, None)
+
     def _cget(self, return_type: type[IntOrStr], option: str) -> IntOrStr | None:
         try:
-            result = Tcl.call({option: return_type}, self._type, "info", self._widget)[option]
+            value = self._info()[option]
         except KeyError:
             return None
         else:
-            return result
+            return Tcl.from_(return_type, value)
 
     def _config(self, **kwargs: Any) -> None:
+        self._invalidate()
         Tcl.call(None, self._type, "configure", self._widget, *Tcl.to_tcl_args(**kwargs))
 
 
@@ -57,6 +76,7 @@ class Grid(LayoutManager):
             self._set_cell(cell)
             row = col = rowspan = colspan = None
 
+        self._invalidate()
         Tcl.call(
             None,
             "grid",
@@ -79,6 +99,7 @@ class Grid(LayoutManager):
         except KeyError:
             raise LayoutError(f"cell {cell_name!r} doesn't exists") from None
 
+        self._invalidate()
         Tcl.call(
             None,
             "grid",
@@ -143,17 +164,16 @@ class Grid(LayoutManager):
 
         return None, None
 
+    def _hide(self) -> None:
+        self._invalidate()
+        Tcl.call(None, "grid", "remove", self._widget)
+
+    def _unhide(self) -> None:
+        self._invalidate()
+        Tcl.call(None, "grid", self._widget)
+
     def _get_pad(self):
-        result = Tcl.call(
-            {
-                "-padx": (int,),
-                "-pady": (int,),
-            },
-            "grid",
-            "info",
-            self._widget,
-        )
-        return result["-padx"], result["-pady"]
+        return self._cget((int,), "-padx"), self._cget((int,), "-pady")
 
     @property
     def location(self) -> tuple[int | None, int | None]:
@@ -257,6 +277,7 @@ class Geometry(LayoutManager):
         bottom: float | None = None,
     ):
         warnings.warn("This layout manager is WIP. Some things may not work.", Warning)
+        self._invalidate()
 
         x, y = left, top
         rely = relheight = height = None
@@ -340,6 +361,7 @@ class Position(LayoutManager):
         height: float | None = None,
         anchor: Anchor | None = None,
     ):
+        self._invalidate()
         Tcl.call(
             None,
             "place",
@@ -423,14 +445,28 @@ class GridCells:
         return result
 
     @staticmethod
-    def _update(owner):
-        for widget, cell in owner.grid._cell_managed_children.items():
-            widget.grid._set_cell(cell)  # _set_cell does the update
+    def _changed_cells(old: dict[str, dict[str, Any]], new: dict[str, dict[str, Any]]) -> set[str]:
+        keys = ("row", "col", "rowspan", "colspan")
+        changed = {
+            name
+            for name, cell in new.items()
+            if name not in old or any(old[name][key] != cell[key] for key in keys)
+        }
+        # Widgets in a removed cell have to be updated too, so they raise a LayoutError
+        return changed | (old.keys() - new.keys())
+
+    @staticmethod
+    def _update(grid: ToplevelGrid, changed: set[str]) -> None:
+        with Tcl.batch():
+            for widget, cell in grid._cell_managed_children.items():
+                if cell in changed:
+                    widget.grid._set_cell(cell)  # _set_cell does the update
 
     def __set__(self, obj, value: list[list[str | None]]) -> None:
+        old_values = obj._cells_values
         obj._cells = value
         obj._cells_values = GridCells._parse(value)
-        GridCells._update(obj._widget)
+        GridCells._update(obj, GridCells._changed_cells(old_values, obj._cells_values))
 
     def __get__(self, obj, *_) -> list[list[str | None]]:
         return obj._cells
@@ -440,14 +476,26 @@ class ToplevelGrid:
     # TODO: row/col weight
     # TODO: row/col gap
 
-    _cells = []
-    _cells_values = {}
-    _cell_managed_children = {}
+    _cells: list[list[str | None]]
+    _cells_values: dict[str, dict[str, Any]]
+    _cell_managed_children: dict[WidgetBase, str]
 
     cells = GridCells()
 
     def __init__(self, owner: ToplevelBase) -> None:
         self._widget = owner
+        self._cells = []
+        self._cells_values = {}
+        self._cell_managed_children = {}
+
+    def place_many(self, placements: Iterable[tuple[WidgetBase, dict[str, Any]]]) -> None:
+        """
+        Place several widgets on the grid in a single round-trip. `placements`
+        contains (widget, keyword arguments for `widget.grid()`) pairs.
+        """
+        with Tcl.batch():
+            for widget, options in placements:
+                widget.grid(**options)
 
     @property
     def size(self) -> tuple[int, int]:
@@ -458,4 +506,6 @@ class ToplevelGrid:
 
 
 class ContainerGrid(Grid, ToplevelGrid):
-    ...
+    def __init__(self, owner: WidgetBase) -> None:
+        Grid.__init__(self, owner)
+        ToplevelGrid.__init__(self, owner)  # type: ignore
@@ -17,6 +17,18 @@ class Bbox(NamedTuple):
     height: int
 
 
+class GeometrySnapshot(NamedTuple):
+    abs_x: int
+    abs_y: int
+    rel_x: int
+    rel_y: int
+    width: int
+    height: int
+    requested_width: int
+    requested_height: int
+    mapped: bool
+
+
 class Position(NamedTuple):
     x: int
     y: int
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from tukaan._collect import widgets
 from tukaan._layout import Grid
-from tukaan._misc import Bbox
+from tukaan._misc import Bbox, GeometrySnapshot
 from tukaan._tcl import Tcl
 
 if TYPE_CHECKING:
@@ -37,43 +37,93 @@ class WidgetMixin:
         return widgets[tcl_value]
 
 
-class GeometryMixin:
-    def _abs_x(self) -> int:
-        return Tcl.call(int, "winfo", "rootx", self)
+_GEOMETRY_PROC = """
+namespace eval ::tukaan {}
+proc ::tukaan::geometry {w} {
+    list [winfo rootx $w] [winfo rooty $w] [winfo x $w] [winfo y $w] \\
+        [winfo width $w] [winfo height $w] [winfo reqwidth $w] [winfo reqheight $w] \\
+        [winfo ismapped $w]
+}
+"""
+
+_geometry_cache: dict[str, GeometrySnapshot] = {}
+_geometry_proc_ready = False
+_decode_geometry = Tcl.compile_decoder([int])
+
+
+def geometry_snapshot(path: str) -> GeometrySnapshot:
+    """
+    Return the geometry of a widget, fetched in a single Tcl evaluation.
+
+    Snapshots are cached until the interpreter is synced next time. Anything
+    that can move a widget (a call from Python, or an event handled by the
+    event loop) marks the interpreter dirty, so it can't be skipped by a
+    binding that breaks, unlike a <Configure> binding.
+    """
+    global _geometry_proc_ready
+
+    if not _geometry_proc_ready:
+        Tcl.eval(None, _GEOMETRY_PROC)
+        _geometry_proc_ready = True
 
-    def _abs_y(self) -> int:
-        return Tcl.call(int, "winfo", "rooty", self)
+    Tcl.sync()
 
-    def _rel_x(self) -> int:
-        return Tcl.call(int, "winfo", "x", self)
+    try:
+        return _geometry_cache[path]
+    except KeyError:
+        values = _decode_geometry(Tcl.call(object, "::tukaan::geometry", path))
+        result = _geometry_cache[path] = GeometrySnapshot(*values[:8], bool(values[8]))
+        return result
 
-    def _rel_y(self) -> int:
-        return Tcl.call(int, "winfo", "y", self)
 
-    def _width(self) -> int:
-        return Tcl.call(int, "winfo", "reqwidth", self)
+Tcl._sync_hooks.append(_geometry_cache.clear)
 
-    def _height(self) -> int:
-        return Tcl.call(int, "winfo", "reqheight", self)
+
+class GeometryMixin:
+    _name: str
+
+    def geometry_snapshot(self) -> GeometrySnapshot:
+        """Return the position, size and mapped state of this widget at once."""
+        return geometry_snapshot(self._name)
 
     @property
-    @Tcl.redraw_before
     def bbox(self) -> Bbox:
-        return Bbox(self._abs_x(), self._abs_y(), self._width(), self._height())
+        geometry = geometry_snapshot(self._name)
+        return Bbox(
+            geometry.abs_x, geometry.abs_y, geometry.requested_width, geometry.requested_height
+        )
 
-    rel_x = property(Tcl.redraw_before(_rel_x))
-    rel_y = property(Tcl.redraw_before(_rel_y))
-    abs_x = property(Tcl.redraw_before(_abs_x))
-    abs_y = property(Tcl.redraw_before(_abs_y))
-    width = property(Tcl.redraw_before(_width))
-    height = property(Tcl.redraw_before(_height))
+    @property
+    def rel_x(self) -> int:
+        return geometry_snapshot(self._name).rel_x
+
+    @property
+    def rel_y(self) -> int:
+        return geometry_snapshot(self._name).rel_y
+
+    @property
+    def abs_x(self) -> int:
+        return geometry_snapshot(self._name).abs_x
+
+    @property
+    def abs_y(self) -> int:
+        return geometry_snapshot(self._name).abs_y
+
+    @property
+    def width(self) -> int:
+        return geometry_snapshot(self._name).requested_width
+
+    @property
+    def height(self) -> int:
+        return geometry_snapshot(self._name).requested_height
 
 
 class VisibilityMixin:
+    _name: str
+
     @property
-    @Tcl.redraw_before
     def visible(self) -> bool:
-        return Tcl.call(bool, "winfo", "ismapped", self)
+        return geometry_snapshot(self._name).mapped
 
     @visible.setter
     def visible(self, value: bool) -> None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+import weakref
 from typing import TYPE_CHECKING, Any, Optional, Tuple, Union
 
 if sys.version_info >= (3, 9):
@@ -12,8 +13,7 @@ else:
 
 from pathlib import Path
 
-from tukaan._collect import commands
-from tukaan._tcl import Tcl
+from tukaan._tcl import Tcl, TclCallback
 from tukaan._typing import P, T, T_co, T_contra
 from tukaan._variables import ControlVariable
 from tukaan.colors import Color
@@ -23,18 +23,140 @@ if TYPE_CHECKING:
     from tukaan._base import TkWidget
 
 
+# Options that Tcl can change without a configure call. The value of some widgets
+# moves by itself, and the state of ttk widgets also follows their `state` command.
+_VOLATILE_OPTIONS = frozenset({"-value", "-state"})
+# Options that mirror a linked variable, when the widget has one
+_LINKED_OPTIONS = {"-text": "-textvariable"}
+# Options that Tk stores exactly as they're set, so writes can go to the cache too.
+# Tk normalizes the rest (colors, distances, fonts, paddings), so they're refetched.
+_EXACT_OPTIONS = frozenset(
+    {
+        "-command",
+        "-takefocus",
+        "-text",
+        "-textvariable",
+        "-variable",
+        "-xscrollcommand",
+        "-yscrollcommand",
+    }
+)
+_STALE = object()
+# Theme and font or scaling changes can change the defaults of every widget
+_INVALIDATE_PROC = """
+namespace eval ::tukaan {
+    variable options_cached 1
+
+    proc invalidate_options {} {
+        if {$::tukaan::options_cached} {
+            set ::tukaan::options_cached 0
+            %s
+        }
+    }
+}
+bind all <<ThemeChanged>> {+::tukaan::invalidate_options}
+bind all <<TkWorldChanged>> {+::tukaan::invalidate_options}
+"""
+
+_cached_widgets: weakref.WeakSet[TkWidget] = weakref.WeakSet()
+_invalidate_command: TclCallback | None = None
+_decode_options = Tcl.compile_decoder([[object]])
+
+
+def fill_option_cache(widget: TkWidget) -> None:
+    """Mirror every option of the widget, fetched with a single configure call."""
+    global _invalidate_command
+
+    if _invalidate_command is None:
+        _invalidate_command = TclCallback(invalidate_option_caches)
+        Tcl.eval(None, _INVALIDATE_PROC % _invalidate_command._name)
+
+    options = Tcl.eval(object, f"set ::tukaan::options_cached 1\n{widget._name} configure")
+    widget._option_cache = {
+        spec[0]: spec[-1]
+        for spec in _decode_options(options)
+        if len(spec) == 5  # Aliases, like -bg, have only two elements
+    }
+    widget._decoded_options = {}
+    _cached_widgets.add(widget)
+
+
+def drop_option_cache(widget: TkWidget) -> None:
+    widget._option_cache = widget._decoded_options = None
+    _cached_widgets.discard(widget)
+
+
+def invalidate_option_caches() -> None:
+    """Refetch the options of the cached widgets on the next read (e.g. after a theme change)."""
+    for widget in _cached_widgets:
+        reset_option_cache(widget)
+
+
 def cget(widget: TkWidget, return_type: T | type[T], option: str) -> T:
-    return Tcl.call(return_type, widget, "cget", option)
+    cache = getattr(widget, "_option_cache", None)
+    if cache is None or option in _VOLATILE_OPTIONS:
+        return Tcl.call(return_type, widget, "cget", option)
+
+    if not cache:
+        fill_option_cache(widget)
+        cache = widget._option_cache
+
+    linked = _LINKED_OPTIONS.get(option)
+    if linked is not None and cache.get(linked):
+        return Tcl.call(return_type, widget, "cget", option)
+
+    try:
+        value = cache[option]
+    except KeyError:
+        return Tcl.call(return_type, widget, "cget", option)
+
+    if value is _STALE:
+        value = cache[option] = Tcl.call(object, widget, "cget", option)
+
+    key = (option, return_type)
+    decoded = widget._decoded_options
+    try:
+        return decoded[key]
+    except KeyError:
+        result = decoded[key] = Tcl.from_(return_type, value)
+        return result
+    except TypeError:  # unhashable return type
+        return Tcl.from_(return_type, value)
 
 
 def config(widget: TkWidget, **kwargs: Any) -> None:
-    assert len(kwargs) == 1
+    """
+    Set any number of Tcl options in a single configure call.
+    A trailing underscore is stripped from the option names (e.g. `from_`).
+    """
+    args: list[Any] = []
+    for key, value in kwargs.items():
+        key = key.rstrip("_")
+        if value is None:
+            value = ""
 
-    ((key, value),) = kwargs.items()
-    if value is None:
-        value = ""
+        if callable(value):
+            value = TclCallback.register(widget, key, value)
+        else:
+            TclCallback.unregister(widget, key)
 
-    Tcl.call(None, widget, "configure", f"-{key}", value)
+        args.extend((f"-{key}", value))
+
+    Tcl.call(None, widget, "configure", *args)
+
+    cache = getattr(widget, "_option_cache", None)
+    if cache:
+        for option, value in zip(args[::2], args[1::2]):
+            cache[option] = Tcl.to(value) if option in _EXACT_OPTIONS else _STALE
+        widget._decoded_options.clear()
+        # If Tk rejects the values when the batch is sent, refetch everything on the next read
+        Tcl.on_batch_error(lambda: reset_option_cache(widget))
+
+
+def reset_option_cache(widget: TkWidget) -> None:
+    if widget._option_cache is not None:
+        widget._option_cache = {}
+        widget._decoded_options = {}
 
 
 class RWProperty(Protocol[T_co, T_contra]):
@@ -49,15 +171,20 @@ class OptionDesc(RWProperty[T, T_contra]):
     def __init__(self, option: str, type_: type[T]) -> None:
         self._option = option
         self._type = type_
+        self._decode = Tcl.compile_decoder(type_)
 
     def __get__(self, instance: TkWidget, owner: object = None) -> T:
         if owner is None:
             return NotImplemented
-        return cget(instance, self._type, f"-{self._option}")
+        return cget(instance, self._decode, f"-{self._option}")
 
     def __set__(self, instance: TkWidget, value: T_contra) -> None:
         config(instance, **{self._option: value})
 
+    def to_option(self, value: T_contra) -> tuple[str, Any]:
+        """Return the Tcl option name and value, that setting this property to `value` means."""
+        return self._option, value
+
 
 class BoolDesc(OptionDesc[bool, bool]):
     def __init__(self, option: str) -> None:
@@ -106,11 +233,14 @@ class CommandProp(OptionDesc[Optional[Callable[P, T]], Optional[Callable[P, T]]]
     def __get__(self, instance: TkWidget, owner: object = None):
         if owner is None:
             return NotImplemented
-        return commands.get(cget(instance, str, "-command"))
+        return TclCallback.lookup(cget(instance, str, "-command"))
 
     def __set__(self, instance: TkWidget, value: Callable[P, T] | None = None) -> None:
         super().__set__(instance, value or "")
 
+    def to_option(self, value: Callable[P, T] | None) -> tuple[str, Any]:
+        return self._option, value or ""
+
 
 class ImagePositionProp(OptionDesc[ImagePosition, ImagePosition]):
     def __init__(self) -> None:
@@ -182,3 +312,6 @@ class PaddingProp(RWProperty[PaddingType, Union[int, Tuple[int, ...], None]]):
 
     def __set__(self, instance: TkWidget, value: int | tuple[int, ...] | None) -> None:
         config(instance, padding=_convert_padding(value))
+
+    def to_option(self, value: int | tuple[int, ...] | None) -> tuple[str, Any]:
+        return "padding", _convert_padding(value)
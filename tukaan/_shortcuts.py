@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import collections
+import itertools
+from typing import Any, Callable, Dict, FrozenSet, Tuple
+
+from tukaan._events import SHORTCUT_STATE_BITS, KeySeq, _keysyms_for
+from tukaan._keysyms import keysym_aliases
+from tukaan._tcl import Tcl, TclCallback
+
+_ShortcutKey = Tuple[FrozenSet[str], str]
+_ScopeTable = Dict[Any, Callable[[], Any]]
+
+_STATE_MASK = sum(SHORTCUT_STATE_BITS)
+_STATE_MODIFIERS = {
+    sum(bits): frozenset(SHORTCUT_STATE_BITS[bit] for bit in bits)
+    for length in range(len(SHORTCUT_STATE_BITS) + 1)
+    for bits in itertools.combinations(SHORTCUT_STATE_BITS, length)
+}
+
+
+def _normalize_key(key: str) -> str:
+    return key.lower() if len(key) == 1 else key
+
+
+def _shortcut_key(sequence: KeySeq) -> _ShortcutKey:
+    *modifiers, key = sequence._sequence
+    return frozenset(modifiers), _normalize_key(key)
+
+
+def _scope_path(scope: Any) -> str | None:
+    if scope is None:
+        return None
+    return scope._wm_path if hasattr(scope, "_wm_path") else scope._name
+
+
+class ShortcutRegistry:
+    """
+    Application-wide keyboard shortcuts.
+
+    All shortcuts are handled by a single binding on the `all` tag. Key
+    presses are filtered in Tcl, so only keysyms that are part of a shortcut
+    call into Python, where the callback is looked up in a dict by the
+    modifiers and the key.
+
+    A shortcut can be limited to a window or a widget with `scope`. The
+    shortcut of the focused widget takes precedence over the one of its
+    window, and that over the application-wide one.
+    """
+
+    def __init__(self) -> None:
+        self._table: dict[_ShortcutKey, _ScopeTable] = {}
+        self._keysym_counts: collections.Counter[str] = collections.Counter()
+        self._command: TclCallback | None = None
+
+    def __repr__(self) -> str:
+        return f"<tukaan.ShortcutRegistry: {len(self)} shortcuts>"
+
+    def __len__(self) -> int:
+        return sum(len(scopes) for scopes in self._table.values())
+
+    def __contains__(self, sequence: KeySeq) -> bool:
+        return _shortcut_key(sequence) in self._table
+
+    def add(self, sequence: KeySeq, callback: Callable[[], Any], *, scope: Any = None) -> None:
+        """Call `callback` when `sequence` is pressed. Replaces the callback in the same scope."""
+        if self._command is None:
+            self._command = TclCallback(self._dispatch)
+            Tcl.eval(
+                None,
+                "namespace eval ::tukaan {variable shortcut_keys}\n"
+                + "bind all <KeyPress> {+if {[info exists ::tukaan::shortcut_keys(%K)]} "
+                + f"{{if {{[{self._command._name} %K %s %W [winfo toplevel %W]]}} break}}}}",
+            )
+
+        key = _shortcut_key(sequence)
+        scopes = self._table.setdefault(key, {})
+        if _scope_path(scope) not in scopes:
+            self._add_keysyms(key[1])
+        scopes[_scope_path(scope)] = callback
+
+    def remove(self, sequence: KeySeq, *, scope: Any = None) -> None:
+        key = _shortcut_key(sequence)
+        scopes = self._table.get(key, {})
+        if scopes.pop(_scope_path(scope), None) is None:
+            return
+
+        if not scopes:
+            del self._table[key]
+        self._remove_keysyms(key[1])
+
+    def remap(self, old: KeySeq, new: KeySeq, *, scope: Any = None) -> None:
+        """Move the callback of `old` to `new` in the given scope."""
+        callback = self.get(old, scope=scope)
+        if callback is None:
+            raise KeyError(f"no shortcut for {old.accelerator_sequence!r}")
+
+        self.remove(old, scope=scope)
+        self.add(new, callback, scope=scope)
+
+    def get(self, sequence: KeySeq, *, scope: Any = None) -> Callable[[], Any] | None:
+        return self._table.get(_shortcut_key(sequence), {}).get(_scope_path(scope))
+
+    def _tk_keysyms(self, key: str) -> set[str]:
+        keysyms = _keysyms_for(key)
+        if len(key) == 1:
+            keysyms |= _keysyms_for(key.upper())
+        return keysyms
+
+    def _add_keysyms(self, key: str) -> None:
+        for keysym in self._tk_keysyms(key):
+            self._keysym_counts[keysym] += 1
+            if self._keysym_counts[keysym] == 1:
+                Tcl.call(None, "set", f"::tukaan::shortcut_keys({keysym})", 1)
+
+    def _remove_keysyms(self, key: str) -> None:
+        for keysym in self._tk_keysyms(key):
+            self._keysym_counts[keysym] -= 1
+            if self._keysym_counts[keysym] <= 0:
+                del self._keysym_counts[keysym]
+                Tcl.call(None, "unset", "-nocomplain", f"::tukaan::shortcut_keys({keysym})")
+
+    def _dispatch(self, keysym: str, state: str, widget: str, toplevel: str) -> bool:
+        modifiers = _STATE_MODIFIERS[int(state) & _STATE_MASK]
+        scopes = self._table.get((modifiers, _normalize_key(keysym_aliases.get(keysym, keysym))))
+        if not scopes:
+            return False
+
+        for scope in (widget, toplevel, None):
+            callback = scopes.get(scope)
+            if callback is not None:
+                callback()
+                return True
+
+        return False
@@ -6,42 +6,208 @@ import contextlib
 import functools
 import itertools
 import numbers
+import operator
 import sys
+import time
 import traceback
+import types
+import weakref
 from enum import Enum, EnumMeta
-from inspect import isclass
+from inspect import isclass, ismethod
 from pathlib import Path
-from typing import Any, Callable, Sequence, Union, cast, overload
+from typing import Any, Callable, Iterator, Sequence, Union, cast, overload
 
 import _tkinter as tk
 
-from tukaan._collect import commands, counter
+from tukaan._collect import counter
 from tukaan._typing import P, T, TypeAlias, WrappedFunction
 from tukaan._utils import instanceclassmethod
 from tukaan.exceptions import AppError, TukaanTclError
 
 TclValue: TypeAlias = Union[str, tk.Tcl_Obj]
 
+_PACKAGE_DIR = str(Path(__file__).parent)
+_FRAME_INTERVAL_MS = 1000 / 60
+
+_BATCH_PROC = """
+namespace eval ::tukaan {}
+proc ::tukaan::batch {args} {
+    set index 0
+    foreach command $args {
+        if {[catch {uplevel #0 $command} message]} {
+            return -code error [list $index $message]
+        }
+        incr index
+    }
+}
+"""
+
+
+def _caller_location() -> tuple[str, int, str]:
+    """Return the location of the innermost stack frame outside of Tukaan."""
+    frame = sys._getframe(2)
+    while frame.f_back is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+        frame = frame.f_back
+
+    return frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name
+
+
+_UNNAMED_TYPES = (
+    types.FunctionType,
+    types.MethodType,
+    types.BuiltinFunctionType,
+    functools.partial,
+    Enum,
+)
+
+
+def _as_is(obj: TclValue) -> TclValue:
+    return obj
+
+
+def _encode_bool(obj: bool) -> str:
+    return "1" if obj else "0"
+
+
+def _encode_to_tcl(obj: Any) -> TclValue:
+    return obj.__to_tcl__()
+
+
+def _encode_mapping(obj: collections.abc.Mapping[Any, Any]) -> tuple[TclValue, ...]:
+    return tuple(map(Tcl.to, itertools.chain.from_iterable(obj.items())))  # type: ignore
+
+
+def _encode_callable(obj: Callable[..., Any]) -> str:
+    if ismethod(obj):
+        # The command of a bound method lives as long as its object
+        with contextlib.suppress(TypeError):  # The object can't be referenced weakly
+            return TclCallback.register(obj.__self__, (_encode_callable, obj.__func__), obj)
+
+    return TclCallback.get(obj)._name
+
+
+def _encode_path(obj: Path) -> str:
+    return str(obj.resolve().absolute())
+
+
+def _encode_enum(obj: Enum) -> str:
+    return str(obj.value)
+
+
+def _encode_iterable(obj: Any) -> tuple[TclValue, ...]:
+    try:
+        iter(obj)
+    except TypeError:
+        raise TypeError(
+            "cannot convert Python object to Tcl. Please provide a __to_tcl__ method."
+        ) from None
+    else:
+        return tuple(Tcl.to(o) for o in obj)
+
+
+def _decode_str(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, tk.Tcl_Obj):
+        return str(value.string)
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, tuple):
+        # Let Tcl quote the list elements properly
+        return Tcl._interp.call("format", "%s", value)
+
+    return str(value)
+
+
+def _decode_with_str(decoder: Callable[[str], T]) -> Callable[[Any], T]:
+    """Wrap decoders, that can only handle string values."""
+
+    def decode(value: Any) -> T:
+        return decoder(value if isinstance(value, str) else _decode_str(value))
+
+    return decode
+
+
+def _splitlist(value: TclValue) -> tuple[Any, ...]:
+    # With wantobjects, a one-element list of a number comes back as a bare int or float
+    if isinstance(value, (int, float)):
+        return (value,)
+    return Tcl._interp.splitlist(value)  # type: ignore
+
+
+def _shared_key(callback: Callable[..., Any]) -> Any:
+    """Bound methods are shared by a weak reference, so the key doesn't keep their object alive."""
+    if ismethod(callback):
+        with contextlib.suppress(TypeError):  # The object can't be referenced weakly
+            return weakref.WeakMethod(callback)
+    return callback
+
+
+def _apply(decoder: Callable[[TclValue], Any], value: TclValue) -> Any:
+    return decoder(value)
+
+
+def _freeze_spec(return_type: Any) -> Any:
+    """Make an unhashable return type specification usable as a dict key."""
+    if isinstance(return_type, dict):
+        items = tuple((key, _freeze_spec(value)) for key, value in return_type.items())
+        return (_freeze_spec, dict, items)
+    if isinstance(return_type, (set, list, tuple)):
+        return (_freeze_spec, type(return_type), tuple(map(_freeze_spec, return_type)))
+
+    return return_type
+
 
 class TclCallback:
+    _observers: tuple[Any, ...] = ()
+    _coroutine_runner: Callable[[types.CoroutineType], Any] | None = None
+    _instances: dict[str, TclCallback] = {}
+    _shared: dict[Callable[..., Any], TclCallback] = {}
+    _owned: weakref.WeakKeyDictionary[Any, dict[Any, list[TclCallback]]] = (
+        weakref.WeakKeyDictionary()
+    )
+
     def __init__(
         self,
         callback: Callable[..., Any],
         converters: Sequence[Any] = (),
         args: Sequence[Any] = (),
         kwargs: collections.abc.Mapping[Any, Any] = {},
+        *,
+        once: bool = False,
+        weak: bool = False,
     ):
-        self._callback = callback
+        # A bound method can be referenced weakly, so that the command doesn't keep its object alive
+        self._weak_callback = weakref.WeakMethod(callback) if weak and ismethod(callback) else None
+        self._strong_callback = None if self._weak_callback is not None else callback
+        self._shared_key: Any = callback
         self._converters = converters
         self._args = args
         self._kwargs = kwargs
+        self._once = once
+        self._refcount = 1
 
         self._name = name = f"tukaan_command_{next(counter['commands'])}"
-        commands[name] = callback
+        TclCallback._instances[name] = self
 
         Tcl._interp.createcommand(name, self.__call__)  # type: ignore
 
+    @property
+    def _callback(self) -> Callable[..., Any] | None:
+        if self._weak_callback is not None:
+            return self._weak_callback()
+        return self._strong_callback
+
     def __call__(self, *tcl_args: Any) -> Any:
+        Tcl._dirty = True
+        callback = self._callback
+        if callback is None:
+            return None  # The object of the method is gone
+
+        observers = TclCallback._observers
+        for observer in observers:
+            observer.callback_started(self)
+
         if self._converters and tcl_args:
             result: list[Any] = []
             for index, value in enumerate(tcl_args):
@@ -52,49 +218,211 @@ class TclCallback:
             tcl_args = tuple(result)
 
         try:
-            return self._callback(*tcl_args, *self._args, **self._kwargs)
+            result = callback(*tcl_args, *self._args, **self._kwargs)
+            if isinstance(result, types.CoroutineType):
+                TclCallback.run_coroutine(result)
+                return None
+            return result
         except Exception:
             print("Exception in Tukaan callback:")
             print(traceback.format_exc())
+        finally:
+            for observer in observers:
+                observer.callback_finished(self)
+            if self._once:
+                self.dispose()
+
+    @classmethod
+    def run_coroutine(cls, coro: types.CoroutineType) -> Any:
+        """
+        Run a coroutine returned by a callback with the current coroutine runner.
+        Without an asyncio loop (see App.run_async), it runs as a tukaan.timeouts.Task.
+        """
+        if cls._coroutine_runner is None:
+            from tukaan.timeouts import Task
+
+            return Task(coro)
+
+        return cls._coroutine_runner(coro)
+
+    @classmethod
+    def add_observer(cls, observer: Any) -> None:
+        """
+        Notify `observer` about every callback invocation, by calling its
+        `callback_started` and `callback_finished` methods with the callback.
+        """
+        cls._observers = (*cls._observers, observer)
+
+    @classmethod
+    def remove_observer(cls, observer: Any) -> None:
+        cls._observers = tuple(item for item in cls._observers if item is not observer)
+
+    @classmethod
+    def lookup(cls, name: str) -> Callable[..., Any] | None:
+        """Return the Python callback of a Tukaan command."""
+        instance = cls._instances.get(name)
+        return None if instance is None else instance._callback
+
+    @classmethod
+    def get(cls, callback: Callable[..., Any]) -> TclCallback:
+        """
+        Return a command for `callback`, reusing the existing one, if there's any.
+        Bound methods are referenced weakly.
+        """
+        if isinstance(callback, TclCallback):
+            callback._refcount += 1
+            return callback
+
+        key = _shared_key(callback)
+        weak = isinstance(key, weakref.WeakMethod)
+        try:
+            instance = cls._shared.get(key)
+        except TypeError:  # Unhashable callable, can't be shared
+            return cls(callback, weak=weak)
+
+        if instance is None:
+            instance = cls._shared[key] = cls(callback, weak=weak)
+            instance._shared_key = key
+        else:
+            instance._refcount += 1
+
+        return instance
+
+    def release(self) -> None:
+        """Drop a reference to this command, and delete it, if it was the last one."""
+        self._refcount -= 1
+        if self._refcount <= 0 and self._name in TclCallback._instances:
+            self.dispose()
 
     @instanceclassmethod
     def dispose(self_or_cls, _name: str | None = None) -> None:
         _name = _name or self_or_cls._name
         Tcl._interp.deletecommand(_name)  # type: ignore
-        del commands[_name]
+
+        instance = TclCallback._instances.pop(_name, None)
+        with contextlib.suppress(TypeError):
+            if instance is not None and TclCallback._shared.get(instance._shared_key) is instance:
+                del TclCallback._shared[instance._shared_key]
+
+    @classmethod
+    def register(
+        cls, owner: object, key: Any, callback: Callable[..., Any], *, append: bool = False
+    ) -> str:
+        """
+        Create a command for `callback`, and tie its lifetime to `owner`.
+
+        The command is released, when it's replaced by another one under the
+        same key, when :meth:`TclCallback.unregister` is called, or when the
+        owner gets garbage collected. Bound methods are referenced weakly, so
+        a command like `self.on_click` doesn't keep the owner alive.
+        """
+        instance = cls.get(callback)
+
+        try:
+            slots = cls._owned[owner]
+        except KeyError:
+            slots = cls._owned[owner] = {}
+            weakref.finalize(owner, cls._release_slots, slots)
+
+        if append:
+            slots.setdefault(key, []).append(instance)
+        else:
+            for previous in slots.pop(key, ()):
+                previous.release()
+            slots[key] = [instance]
+
+        return instance._name
+
+    @classmethod
+    def unregister(cls, owner: object, key: Any = None) -> None:
+        """Release the commands of `owner` under `key`, or all of them, if no key is given."""
+        slots = cls._owned.get(owner)
+        if not slots:
+            return
+
+        if key is None:
+            cls._release_slots(slots)
+        else:
+            for instance in slots.pop(key, ()):
+                instance.release()
+
+    @staticmethod
+    def _release_slots(slots: dict[Any, list[TclCallback]]) -> None:
+        for instances in slots.values():
+            for instance in instances:
+                instance.release()
+        slots.clear()
+
+    @classmethod
+    def live_counts(cls) -> collections.Counter[str]:
+        """Return the number of existing commands by the type of their owner."""
+        result: collections.Counter[str] = collections.Counter()
+        owned: set[str] = set()
+
+        for owner, slots in list(cls._owned.items()):
+            for instances in slots.values():
+                for instance in instances:
+                    if instance._name not in owned:
+                        owned.add(instance._name)
+                        result[type(owner).__name__] += 1
+
+        result["unowned"] = len(cls._instances) - len(owned)
+        return result
 
 
 class Tcl:
     """A Python interface to the Tcl interpreter."""
 
     _interp: tk.TkappType
+    _encoders: dict[type, Callable[[Any], Any]] = {}
+    _custom_encoders: dict[type, Callable[[Any], Any]] = {}
+    _decoders: dict[Any, Callable[[TclValue], Any]] = {}
+    _batch: list[tuple[TclValue, ...] | str] | None = None
+    _batch_locations: list[tuple[str, int, str]] = []
+    _batch_error_callbacks: list[Callable[[], Any]] = []
+    _batch_depth = 0
+    _dirty = True
+    _frame_callbacks: dict[int, Callable[[float], Any]] = {}
+    _frame_command: TclCallback | None = None
+    _frame_ids = itertools.count(1)
+    _last_frame = 0.0
+    _sync_hooks: list[Callable[[], Any]] = []
 
     @classmethod
-    def init(cls, app_name: str, screen_name: str | None) -> None:
-        """Initialize the interpreter."""
+    def init(cls, app_name: str, screen_name: str | None, wantobjects: bool = False) -> None:
+        """
+        Initialize the interpreter.
+
+        If `wantobjects` is true, Tcl returns ints, floats and lists as Python
+        objects, instead of strings that have to be parsed again.
+        """
         cls._interp = cast(
             tk.TkappType,
-            tk.create(screen_name, "", app_name, False, False, True, False, None),  # type: ignore
+            tk.create(screen_name, "", app_name, False, wantobjects, True, False, None),  # type: ignore
             # arg #2 'baseName' is ignored in `_tkinter.c`
         )
         cls._interp.loadtk()
         cls._interp.call("wm", "withdraw", ".")
 
         cls.interp_address: int = cls._interp.interpaddr()  # PIL needs this # type: ignore
-        cls.windowing_system = cast(str, cls._interp.call("tk", "windowingsystem")).lower()
-        cls.version: str = cls._interp.call("info", "patchlevel")
-        cls.dll_ext: str = cls._interp.call("info", "sharedlibextension")
+        cls.windowing_system = cls.call(str, "tk", "windowingsystem").lower()
+        cls.version: str = cls.call(str, "info", "patchlevel")
+        cls.dll_ext: str = cls.call(str, "info", "sharedlibextension")
+        cls._interp.eval(_BATCH_PROC)
 
         cls.alive = True
 
     @classmethod
     def main_loop(cls) -> None:
         """Start the main event loop."""
+        cls.flush()
         cls._interp.mainloop(0)  # type: ignore
 
     @classmethod
     def do_one_event(cls) -> None:
+        cls.flush()
         cls._interp.dooneevent(tk.DONT_WAIT)  # type: ignore
+        cls._dirty = True  # Event handlers could have changed anything
         if not cls.alive:
             raise TukaanTclError
 
@@ -146,99 +474,170 @@ class Tcl:
         ...
 
     @staticmethod
-    def to(obj: Any) -> TclValue | tuple[TclValue, ...]:  # noqa: CCR001
-        if isinstance(obj, (str, tk.Tcl_Obj)):
-            return obj
+    def to(obj: Any) -> TclValue | tuple[TclValue, ...]:
+        encoder = Tcl._encoders.get(type(obj))
+        if encoder is None:
+            encoder = Tcl._encoders[type(obj)] = Tcl._resolve_encoder(type(obj))
 
-        if isinstance(obj, bool):
-            return "1" if obj else "0"
+        return encoder(obj)
 
-        if isinstance(obj, numbers.Real):
-            return str(obj)
+    @classmethod
+    def register_encoder(cls, klass: type, encoder: Callable[[Any], TclValue]) -> None:
+        """Use `encoder` to convert instances of `klass` and its subclasses to Tcl."""
+        cls._custom_encoders[klass] = encoder
+        cls._encoders.clear()
 
-        try:
-            return obj._name
-        except AttributeError:
-            pass
+    @classmethod
+    def unregister_encoder(cls, klass: type) -> None:
+        """Stop using the encoder registered for `klass`."""
+        del cls._custom_encoders[klass]
+        cls._encoders.clear()
 
-        try:
-            obj.__to_tcl__
-        except AttributeError:
-            pass
+    @classmethod
+    def _resolve_encoder(cls, klass: type) -> Callable[[Any], Any]:  # noqa: CCR001
+        for base in klass.__mro__:
+            if base in cls._custom_encoders:
+                return cls._custom_encoders[base]
+
+        if issubclass(klass, (str, tk.Tcl_Obj)):
+            return _as_is
+        if issubclass(klass, bool):
+            return _encode_bool
+        if issubclass(klass, numbers.Real):
+            return str
+
+        if hasattr(klass, "_name"):
+            return operator.attrgetter("_name")
+
+        if hasattr(klass, "__to_tcl__"):
+            encoder = _encode_to_tcl
+        elif issubclass(klass, collections.abc.Mapping):
+            encoder = _encode_mapping
+        elif any("__call__" in vars(base) for base in klass.__mro__):
+            encoder = _encode_callable
+        elif issubclass(klass, Path):
+            return _encode_path
+        elif issubclass(klass, Enum):
+            return _encode_enum
         else:
-            return obj.__to_tcl__()
+            encoder = _encode_iterable
 
-        if isinstance(obj, collections.abc.Mapping):
-            return tuple(map(Tcl.to, itertools.chain.from_iterable(obj.items())))  # type: ignore
+        if klass.__dictoffset__ == 0 or issubclass(klass, _UNNAMED_TYPES):
+            # Instances of these can't have a `_name` attribute
+            return encoder
 
-        if callable(obj):
-            return TclCallback(obj)._name
+        def encode_named(obj: Any) -> Any:
+            try:
+                return obj._name
+            except AttributeError:
+                return encoder(obj)
 
-        if isinstance(obj, Path):
-            return str(obj.resolve().absolute())
+        return encode_named
 
-        if isinstance(obj, Enum):
-            return str(obj.value)
+    @staticmethod
+    def from_(return_type: Any, value: TclValue) -> T:
+        return Tcl.compile_decoder(return_type)(value)
 
+    @classmethod
+    def compile_decoder(cls, return_type: Any) -> Callable[[TclValue], Any]:
+        """
+        Compile a return type specification into a function, that converts
+        Tcl values to the specified Python type.
+
+        The resulting decoder is a valid return type itself, so it can be passed
+        to :meth:`Tcl.call` and :meth:`Tcl.eval` instead of the specification.
+        """
         try:
-            iter(obj)
+            decoder = cls._decoders.get(return_type)
         except TypeError:
-            raise TypeError(
-                "cannot convert Python object to Tcl. Please provide a __to_tcl__ method."
-            ) from None
+            key = _freeze_spec(return_type)
+            decoder = cls._decoders.get(key)
         else:
-            return tuple(Tcl.to(o) for o in obj)
+            key = return_type
 
-    @staticmethod
-    def from_(return_type: Any, value: TclValue) -> T:  # noqa: CCR001
-        if isclass(return_type) and isinstance(value, return_type):
-            return value
+        if decoder is None:
+            decoder = cls._decoders[key] = cls._build_decoder(return_type)
+            cls._decoders[decoder] = decoder
 
-        if return_type is bool:
-            return Tcl._interp.getboolean(value)
+        return decoder
 
-        if return_type in (int, float):
-            return return_type(Tcl._interp.getdouble(value))
+    @classmethod
+    def _build_decoder(cls, return_type: Any) -> Callable[[TclValue], Any]:  # noqa: CCR001
+        if isclass(return_type):
+            decode = cls._build_class_decoder(return_type)
 
-        try:
-            return_type.__from_tcl__
-        except AttributeError:
-            pass
-        else:
-            return return_type.__from_tcl__(value)
+            def decode_class(value: TclValue) -> Any:
+                if isinstance(value, return_type):
+                    return value
+                return decode(value)
+
+            return decode_class
+
+        if hasattr(return_type, "__from_tcl__"):
+            return _decode_with_str(return_type.__from_tcl__)
+
+        if isinstance(return_type, (set, list)):
+            [items_type] = return_type
+            container_type = type(return_type)
+            decode_item = cls.compile_decoder(items_type)
 
-        if isinstance(return_type, (set, list, tuple, dict)):
-            sequence = Tcl._interp.splitlist(value)
+            def decode_items(value: TclValue) -> Any:
+                return container_type(map(decode_item, _splitlist(value)))
 
-            if isinstance(return_type, (set, list)):
-                [items_type] = return_type
-                return type(return_type)((Tcl.from_(items_type, item) for item in sequence))
+            return decode_items
 
-            if isinstance(return_type, tuple):
-                diff = len(sequence) - len(return_type)
-                if diff:
-                    return_type = return_type + (return_type[-1],) * diff
-                return tuple(map(Tcl.from_, return_type, sequence))
+        if isinstance(return_type, tuple):
+            decoders = tuple(map(cls.compile_decoder, return_type))
+            decode_last = decoders[-1]
 
-            if isinstance(return_type, dict):
+            def decode_tuple(value: TclValue) -> tuple[Any, ...]:
+                sequence = _splitlist(value)
+                diff = len(sequence) - len(decoders)
+                if diff > 0:
+                    return tuple(map(_apply, decoders + (decode_last,) * diff, sequence))
+                return tuple(map(_apply, decoders, sequence))
+
+            return decode_tuple
+
+        if isinstance(return_type, dict):
+            decoders = {key: cls.compile_decoder(type_) for key, type_ in return_type.items()}
+            decode_str = cls.compile_decoder(str)
+
+            def decode_dict(value: TclValue) -> dict[str, Any]:
+                sequence = _splitlist(value)
                 return {
-                    str(k): Tcl.from_(return_type.get(k, str), v)
+                    str(k): decoders.get(k, decode_str)(v)
                     for k, v in zip(sequence[::2], sequence[1::2])
                 }
 
-        if return_type is str:
-            if isinstance(value, tk.Tcl_Obj):
-                return str(value.string)
+            return decode_dict
 
-            return Tcl._interp.call("format", value)
+        raise TypeError(f"cannot convert Tcl value to {return_type!r}")
+
+    @classmethod
+    def _build_class_decoder(cls, return_type: type) -> Callable[[TclValue], Any]:
+        if return_type is bool:
+            return lambda value: Tcl._interp.getboolean(value)
+
+        if return_type in (int, float):
+            return lambda value: return_type(Tcl._interp.getdouble(value))
+
+        if hasattr(return_type, "__from_tcl__"):
+            return _decode_with_str(return_type.__from_tcl__)
+
+        if return_type is str:
+            return _decode_str
 
         if isinstance(return_type, EnumMeta):
-            return return_type(value)
+            return _decode_with_str(return_type)
 
         if return_type is Path:
-            return Path(Tcl.from_(str, value)).resolve()
+            return lambda value: Path(_decode_str(value)).resolve()
+
+        if return_type is object:
+            return _as_is  # The value as returned by the interpreter
 
-        assert False  # type-guard, sorta
+        raise TypeError(f"cannot convert Tcl value to {return_type!r}")
 
     @staticmethod
     def raise_error(error):
@@ -267,6 +666,16 @@ class Tcl:
 
     @classmethod
     def call(cls, return_type: type[T] | None, *args: Any) -> T | None:
+        if return_type is None:
+            cls._dirty = True
+
+        if cls._batch is not None:
+            if return_type is None:
+                cls._batch.append(tuple([cls.to(arg) for arg in args]))
+                cls._batch_locations.append(_caller_location())
+                return None
+            cls.flush()
+
         try:
             result = cls._interp.call(*[cls.to(arg) for arg in args])
         except tk.TclError as e:
@@ -286,6 +695,16 @@ class Tcl:
 
     @classmethod
     def eval(cls, return_type: Any, script: str) -> Any:
+        if return_type is None:
+            cls._dirty = True
+
+        if cls._batch is not None:
+            if return_type is None:
+                cls._batch.append(script)
+                cls._batch_locations.append(_caller_location())
+                return None
+            cls.flush()
+
         try:
             result = cls._interp.eval(script)
         except tk.TclError as e:
@@ -295,13 +714,130 @@ class Tcl:
                 return
             return cls.from_(return_type, result)
 
+    @classmethod
+    @contextlib.contextmanager
+    def batch(cls) -> Iterator[None]:
+        """
+        Queue every call that doesn't return a value, and send them to Tcl
+        in a single round-trip, when the outermost batch exits.
+
+        Calls that need a return value flush the queue before they run,
+        so they always see the effect of the previous calls. If a queued call
+        fails, the ones queued after it are discarded.
+        """
+        if cls._batch is None:
+            cls._batch = []
+
+        cls._batch_depth += 1
+        try:
+            yield
+        finally:
+            cls._batch_depth -= 1
+            if cls._batch_depth == 0:
+                try:
+                    cls.flush()
+                finally:
+                    cls._batch = None
+
+    @classmethod
+    def on_batch_error(cls, callback: Callable[[], Any]) -> None:
+        """
+        Call `callback`, if the calls queued in the current batch fail when
+        they're sent. Does nothing outside of a batch, where calls raise right away.
+        """
+        if cls._batch is not None:
+            cls._batch_error_callbacks.append(callback)
+
+    @classmethod
+    def flush(cls) -> None:
+        """Send the queued calls of the current batch to Tcl."""
+        if not cls._batch:
+            return
+
+        queue, cls._batch = cls._batch, []
+        locations, cls._batch_locations = cls._batch_locations, []
+        error_callbacks, cls._batch_error_callbacks = cls._batch_error_callbacks, []
+
+        try:
+            cls._interp.call("::tukaan::batch", *queue)
+        except tk.TclError as e:
+            for callback in error_callbacks:
+                callback()
+
+            try:
+                index, message = cls._interp.splitlist(str(e))
+                filename, lineno, func_name = locations[int(index)]
+            except (ValueError, IndexError, tk.TclError):
+                Tcl.raise_error(e)
+            else:
+                Tcl.raise_error(
+                    tk.TclError(
+                        f"{message}\n(in batched call queued at {filename}, "
+                        + f"line {lineno}, in {func_name})"
+                    )
+                )
+
+    @classmethod
+    def sync(cls) -> None:
+        """
+        Process the pending geometry changes and redraws (idle tasks), if
+        anything could have changed since the last time.
+
+        Writes and callbacks mark the interpreter dirty, so consecutive reads
+        flush at most once. Caches of values that Tcl can change (registered
+        in `_sync_hooks`) are cleared at the same time.
+        """
+        if cls._dirty:
+            cls.eval(None, "update idletasks")
+            cls._dirty = False
+            for hook in cls._sync_hooks:
+                hook()
+
+    @classmethod
+    def request_frame(cls, callback: Callable[[float], Any]) -> int:
+        """
+        Call `callback` once, when the event loop is idle next time, before
+        Tk redraws the widgets. It gets a :func:`time.perf_counter` timestamp
+        in milliseconds. Callbacks requested by frame callbacks run in the next
+        frame, at most about 60 frames per second.
+        """
+        if cls._frame_command is None:
+            cls._frame_command = TclCallback(cls._run_frame)
+
+        if not cls._frame_callbacks:
+            # The idle handler is added from a timer, so `update idletasks` in
+            # `Tcl.sync()` never runs frames, and frames requesting frames don't spin
+            delay = max(0, round(cls._last_frame + _FRAME_INTERVAL_MS - time.perf_counter() * 1000))
+            cls.eval(None, f"after {delay} {{after idle {cls._frame_command._name}}}")
+
+        frame_id = next(cls._frame_ids)
+        cls._frame_callbacks[frame_id] = callback
+        return frame_id
+
+    @classmethod
+    def cancel_frame(cls, frame_id: int) -> None:
+        cls._frame_callbacks.pop(frame_id, None)
+
+    @classmethod
+    def _run_frame(cls) -> None:
+        callbacks = cls._frame_callbacks
+        cls._frame_callbacks = {}
+
+        timestamp = cls._last_frame = time.perf_counter() * 1000
+        for callback in callbacks.values():
+            try:
+                callback(timestamp)
+            except Exception:
+                print("Exception in Tukaan frame callback:")
+                print(traceback.format_exc())
+
     @classmethod
     def with_redraw(cls, func: WrappedFunction[P, T]):
         @functools.wraps(func)
         def wrapper(self: Any, *args: P.args, **kwargs: P.kwargs) -> T:
-            cls._interp.eval("update idletasks")
+            cls.sync()
             result = func(self, *args, **kwargs)
-            cls._interp.eval("update idletasks")
+            cls._dirty = True
             return result
 
         return wrapper
@@ -310,7 +846,7 @@ class Tcl:
     def redraw_before(cls, func: WrappedFunction[P, T]):
         @functools.wraps(func)
         def wrapper(self: Any, *args: P.args, **kwargs: P.kwargs) -> T:
-            cls._interp.eval("update idletasks")
+            cls.sync()
             return func(self, *args, **kwargs)
 
         return wrapper
@@ -320,7 +856,7 @@ class Tcl:
         @functools.wraps(func)
         def wrapper(self: Any, *args: P.args, **kwargs: P.kwargs) -> T:
             result = func(self, *args, **kwargs)
-            cls._interp.eval("update idletasks")
+            cls._dirty = True
             return result
 
         return wrapper
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import NoReturn
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, ContextManager, Coroutine, Iterator, NoReturn
 
 try:
     from PIL import _imagingtk as ImagingTk  # type: ignore  # noqa: N812
@@ -9,13 +10,24 @@ except ImportError as e:
 
 from libtukaan import Serif, Xcursor
 
-from tukaan._tcl import Tcl
+from tukaan._async import AsyncioBridge
+from tukaan._background import BackgroundTask, run_in_background
+from tukaan._dispatch import Dispatcher
+from tukaan._event_bus import EventBus
+from tukaan._props import invalidate_option_caches
+from tukaan._shortcuts import ShortcutRegistry
+from tukaan._tcl import Tcl, TclCallback
 from tukaan.theming import LookAndFeel, NativeTheme, Theme
+from tukaan.timeouts import IdleTask, idle_scheduler
 
 
 class App:
     _exists = False
+    _dispatcher: Dispatcher
+    _executor: Executor | None = None
     shared_instance: App
+    shortcuts: ShortcutRegistry
+    event_bus: EventBus
 
     def __init__(
         self,
@@ -24,12 +36,13 @@ class App:
         version: int | str = "1.0",
         *,
         screen: str | None = None,
+        wantobjects: bool = False,
     ) -> None:
         if App._exists:
             raise Exception
 
         try:
-            Tcl.init(name.capitalize().replace(" ", "_"), screen)
+            Tcl.init(name.capitalize().replace(" ", "_"), screen, wantobjects)
         except Exception as e:
             raise e
         else:
@@ -39,6 +52,9 @@ class App:
         if Tcl.windowing_system == "x11":
             Xcursor.init()
         ImagingTk.tkinit(Tcl.interp_address)
+        App._dispatcher = Dispatcher()
+        App.shortcuts = ShortcutRegistry()
+        App.event_bus = EventBus()
 
         NativeTheme.use()
 
@@ -76,6 +92,11 @@ class App:
         # TODO: implement screen handling for window classes, not for App
         return Tcl.call(str, "winfo", "screen", ".")
 
+    @property
+    def live_commands(self) -> dict[str, int]:
+        """Return the number of Tcl commands created by Tukaan, by the type of their owner."""
+        return dict(TclCallback.live_counts())
+
     @property
     def theme(self) -> None:
         ...
@@ -84,17 +105,107 @@ class App:
     def theme(self, theme: Theme) -> None:
         theme.use()
         LookAndFeel._is_current_theme_native = theme.is_native
+        invalidate_option_caches()
 
     @classmethod
     def quit(cls) -> None:
         """Destroy all widgets and quit the Tcl interpreter."""
         Serif.cleanup()
         Xcursor.cleanup_cursors()
+        cls._dispatcher.close()
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False)
         Tcl.call(None, "destroy", ".app")
         Tcl.call(None, "destroy", ".")
         Tcl.quit()
 
+    @classmethod
+    def batch(cls) -> ContextManager[None]:
+        """Send the Tcl calls made in this context in a single round-trip. See :meth:`Tcl.batch`."""
+        return Tcl.batch()
+
+    @classmethod
+    def call_soon_threadsafe(cls, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Call `func` on the GUI thread from any thread, and return a
+        :class:`concurrent.futures.Future` for its result.
+        """
+        return cls._dispatcher.submit(func, *args, **kwargs)
+
+    @property
+    def executor(self) -> Executor:
+        """The pool used by :meth:`run_in_background`. A thread pool by default."""
+        if App._executor is None:
+            App._executor = ThreadPoolExecutor(thread_name_prefix="tukaan-background")
+        return App._executor
+
+    @executor.setter
+    def executor(self, executor: Executor) -> None:
+        if App._executor is not None:
+            App._executor.shutdown(wait=False)
+        App._executor = executor
+
+    def run_in_background(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        on_done: Callable[[Any], Any] | None = None,
+        on_progress: Callable[[float], Any] | None = None,
+        on_error: Callable[[BaseException], Any] | None = None,
+        **kwargs: Any,
+    ) -> BackgroundTask:
+        """
+        Run `func` in the background executor, without blocking the event loop.
+
+        If `func` accepts a `progress` argument, it gets a function to report
+        its progress between 0 and 1 (not supported with process pools).
+        `on_done` is called with the result, `on_error` with the exception if
+        `func` fails, and `on_progress` with the latest progress, all on the GUI thread.
+        """
+        task = run_in_background(self.executor, self._dispatcher, func, args, kwargs)
+        if on_progress is not None:
+            task.add_progress_callback(on_progress)
+        if on_done is not None:
+            task.add_done_callback(on_done)
+        if on_error is not None:
+            task.add_error_callback(on_error)
+        return task
+
+    @classmethod
+    def request_frame(cls, callback: Callable[[float], Any]) -> int:
+        """Call `callback` before the next redraw. See :meth:`Tcl.request_frame`."""
+        return Tcl.request_frame(callback)
+
+    @classmethod
+    def cancel_frame(cls, frame_id: int) -> None:
+        Tcl.cancel_frame(frame_id)
+
+    @classmethod
+    def schedule_idle(
+        cls, generator: Iterator[Any], budget_ms: int = 8, *, priority: int = 0
+    ) -> IdleTask:
+        """
+        Run `generator` step by step when the event loop is idle, for at most
+        `budget_ms` milliseconds at once, so the UI stays responsive.
+        """
+        return idle_scheduler.schedule(generator, priority, budget_ms)
+
     @classmethod
     def run(cls) -> None:
         """Start the main event loop."""
         Tcl.main_loop()
+
+    @classmethod
+    def run_async(cls, main: Coroutine[Any, Any, Any] | None = None) -> None:
+        """
+        Start the main event loop together with an asyncio event loop.
+
+        `main` is started as a task, and callbacks can be coroutine functions too.
+        """
+        bridge = AsyncioBridge()
+        try:
+            if main is not None:
+                bridge.create_task(main)
+            Tcl.main_loop()
+        finally:
+            bridge.close()
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import bisect
+import collections
+import contextlib
+import math
+import sys
+import threading
+import traceback
+from time import perf_counter
+from typing import Any, Callable, Iterator, NamedTuple
+
+import _tkinter as tk
+
+from tukaan._tcl import Tcl, TclCallback, _caller_location
+
+
+class CallStats(NamedTuple):
+    count: int
+    total: float
+    conversion: float
+    interpreter: float
+    p50: float
+    p90: float
+    p99: float
+    call_sites: dict[str, int]
+
+    def __repr__(self) -> str:
+        return (
+            f"<CallStats: count={self.count}, total={self.total * 1000:.3f}ms, "
+            + f"p50={self.p50 * 1000:.3f}ms, p99={self.p99 * 1000:.3f}ms>"
+        )
+
+
+class _Record:
+    __slots__ = ("count", "total", "conversion", "interpreter", "samples", "call_sites")
+
+    def __init__(self, max_samples: int) -> None:
+        self.count = 0
+        self.total = self.conversion = self.interpreter = 0.0
+        self.samples: collections.deque[float] = collections.deque(maxlen=max_samples)
+        self.call_sites: collections.Counter[str] = collections.Counter()
+
+    def add(self, total: float, conversion: float, interpreter: float, site: str) -> None:
+        self.count += 1
+        self.total += total
+        self.conversion += conversion
+        self.interpreter += interpreter
+        self.samples.append(total)
+        self.call_sites[site] += 1
+
+    def stats(self) -> CallStats:
+        samples = sorted(self.samples)
+        last = len(samples) - 1
+
+        return CallStats(
+            self.count,
+            self.total,
+            self.conversion,
+            self.interpreter,
+            samples[round(last * 0.5)],
+            samples[round(last * 0.9)],
+            samples[round(last * 0.99)],
+            dict(self.call_sites.most_common()),
+        )
+
+
+class Profile:
+    """
+    Statistics about the Tcl calls, and the callbacks Tcl calls back into.
+
+    Latency percentiles are calculated from the last `max_samples` calls of each command.
+    """
+
+    def __init__(self, max_samples: int = 1000) -> None:
+        self._max_samples = max_samples
+        self._records: dict[str, _Record] = {}
+
+    def record(
+        self, name: str, total: float, conversion: float, interpreter: float, site: str
+    ) -> None:
+        try:
+            record = self._records[name]
+        except KeyError:
+            record = self._records[name] = _Record(self._max_samples)
+
+        record.add(total, conversion, interpreter, site)
+
+    def snapshot(self) -> dict[str, CallStats]:
+        """Return the statistics collected so far, the most time consuming commands first."""
+        result = {name: record.stats() for name, record in self._records.items()}
+        return dict(sorted(result.items(), key=lambda item: item[1].total, reverse=True))
+
+    def reset(self) -> None:
+        self._records.clear()
+
+
+class _CallbackObserver:
+    def __init__(self) -> None:
+        self._started: list[float] = []
+
+    def callback_started(self, callback: TclCallback) -> None:
+        self._started.append(perf_counter())
+
+    def callback_finished(self, callback: TclCallback) -> None:
+        elapsed = perf_counter() - self._started.pop()
+        name, site = _callback_name(callback._callback)
+
+        for profile in _active_profiles:
+            profile.record(name, elapsed, 0.0, 0.0, site)
+
+
+_global_profile = Profile()
+_active_profiles: list[Profile] = []
+_callback_observer = _CallbackObserver()
+_original_call = Tcl.__dict__["call"]
+_original_eval = Tcl.__dict__["eval"]
+_original_flush = Tcl.__dict__["flush"]
+
+
+def _command_name(args: tuple[Any, ...]) -> str:
+    if not args:
+        return ""
+
+    first = args[0]
+    if isinstance(first, str):
+        name = "<widget>" if first.startswith(".") else first
+    else:
+        name = f"<{getattr(first, '_tcl_class', type(first).__name__)}>"
+
+    if len(args) > 1 and isinstance(args[1], str) and args[1].isidentifier():
+        name += " " + args[1]
+
+    return name
+
+
+def _callback_name(callback: Any) -> tuple[str, str]:
+    func = getattr(callback, "func", callback)  # functools.partial
+    code = getattr(func, "__code__", None)
+    site = "" if code is None else f"{code.co_filename}:{code.co_firstlineno}"
+
+    return f"callback {getattr(func, '__qualname__', repr(func))}", site
+
+
+def _format_location() -> str:
+    filename, lineno, func_name = _caller_location()
+    return f"{filename}:{lineno} ({func_name})"
+
+
+def _profiled_call(cls: type[Tcl], return_type: Any, *args: Any) -> Any:
+    # Does the same as Tcl.call, with timestamps in between
+    site = _format_location()
+    if return_type is not None:
+        cls.flush()  # Recorded by itself
+
+    start = perf_counter()
+    if return_type is None:
+        cls._dirty = True
+
+    converted = tuple([cls.to(arg) for arg in args])
+    converted_at = perf_counter()
+
+    if return_type is None and cls._batch is not None:
+        cls._batch.append(converted)
+        cls._batch_locations.append(_caller_location())
+        raw = None
+    else:
+        try:
+            raw = cls._interp.call(*converted)
+        except tk.TclError as e:
+            cls.raise_error(e)
+
+    returned_at = perf_counter()
+    result = None if return_type is None else cls.from_(return_type, raw)
+    end = perf_counter()
+
+    name = _command_name(args)
+    conversion = (converted_at - start) + (end - returned_at)
+    for profile in _active_profiles:
+        profile.record(name, end - start, conversion, returned_at - converted_at, site)
+
+    return result
+
+
+def _profiled_eval(cls: type[Tcl], return_type: Any, script: str) -> Any:
+    site = _format_location()
+    start = perf_counter()
+
+    raw = _original_eval.__get__(None, cls)(None if return_type is None else object, script)
+
+    returned_at = perf_counter()
+    result = None if return_type is None else cls.from_(return_type, raw)
+    end = perf_counter()
+
+    name = " ".join(word for word in script.split(None, 2)[:2] if word.isidentifier())
+    for profile in _active_profiles:
+        profile.record(name, end - start, end - returned_at, returned_at - start, site)
+
+    return result
+
+
+def _profiled_flush(cls: type[Tcl]) -> None:
+    if not cls._batch:
+        return
+
+    # The queued calls are recorded when they're queued, this records the round-trip
+    site = _format_location()
+    start = perf_counter()
+    _original_flush.__get__(None, cls)()
+    elapsed = perf_counter() - start
+
+    for profile in _active_profiles:
+        profile.record("::tukaan::batch", elapsed, 0.0, elapsed, site)
+
+
+def _activate(profile: Profile) -> None:
+    if not _active_profiles:
+        Tcl.call = classmethod(_profiled_call)  # type: ignore
+        Tcl.eval = classmethod(_profiled_eval)  # type: ignore
+        Tcl.flush = classmethod(_profiled_flush)  # type: ignore
+        TclCallback.add_observer(_callback_observer)
+
+    if profile not in _active_profiles:
+        _active_profiles.append(profile)
+
+
+def _deactivate(profile: Profile) -> None:
+    if profile in _active_profiles:
+        _active_profiles.remove(profile)
+
+    if not _active_profiles:
+        Tcl.call = _original_call  # type: ignore
+        Tcl.eval = _original_eval  # type: ignore
+        Tcl.flush = _original_flush  # type: ignore
+        TclCallback.remove_observer(_callback_observer)
+
+
+def enable() -> None:
+    """Start recording Tcl calls into the global profile."""
+    _activate(_global_profile)
+
+
+def disable() -> None:
+    """Stop recording Tcl calls into the global profile."""
+    _deactivate(_global_profile)
+
+
+def reset() -> None:
+    """Clear the statistics of the global profile."""
+    _global_profile.reset()
+
+
+def snapshot() -> dict[str, CallStats]:
+    """Return the statistics of the global profile. See :meth:`Profile.snapshot`."""
+    return _global_profile.snapshot()
+
+
+@contextlib.contextmanager
+def profile(max_samples: int = 1000) -> Iterator[Profile]:
+    """Record the Tcl calls made in this context into a new profile."""
+    scoped_profile = Profile(max_samples)
+    _activate(scoped_profile)
+
+    try:
+        yield scoped_profile
+    finally:
+        _deactivate(scoped_profile)
+
+
+class Stall(NamedTuple):
+    callback: str
+    duration: float
+    stack: list[str]
+
+    def __repr__(self) -> str:
+        return f"<Stall: {self.callback} blocked for {self.duration * 1000:.0f}ms>"
+
+
+def _print_stall(stall: Stall) -> None:
+    print(
+        f"Tukaan event loop blocked for {stall.duration * 1000:.0f}ms "
+        + f"in {stall.callback}:\n{''.join(stall.stack)}",
+        file=sys.stderr,
+    )
+
+
+class StallWatchdog:
+    """
+    Watch the event loop from a helper thread, and report callbacks that keep
+    it from processing events for longer than `budget` seconds.
+
+    `on_stall` is called from the helper thread with a :class:`Stall`, that
+    contains the stack of the callback at the time it was detected.
+    """
+
+    buckets: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, math.inf)
+
+    def __init__(
+        self, budget: float = 0.1, on_stall: Callable[[Stall], None] | None = _print_stall
+    ) -> None:
+        self.budget = budget
+        self.on_stall = on_stall
+        self.stalls: collections.deque[Stall] = collections.deque(maxlen=100)
+
+        self._counts = [0] * len(self.buckets)
+        self._depth = 0
+        self._started = 0.0
+        self._callback: TclCallback | None = None
+        self._invocation = 0
+        self._reported = 0
+        self._thread_id = 0
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> StallWatchdog:
+        self.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    @property
+    def histogram(self) -> dict[float, int]:
+        """Number of stalls by duration. The keys are the upper bounds of the buckets in seconds."""
+        return dict(zip(self.buckets, self._counts))
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._watch, name="tukaan-watchdog", daemon=True)
+        self._thread.start()
+        TclCallback.add_observer(self)
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+
+        TclCallback.remove_observer(self)
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def callback_started(self, callback: TclCallback) -> None:
+        self._depth += 1
+        if self._depth == 1:
+            self._thread_id = threading.get_ident()
+            self._started = perf_counter()
+            self._invocation += 1
+            self._callback = callback
+
+    def callback_finished(self, callback: TclCallback) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
+
+        duration = perf_counter() - self._started
+        self._callback = None
+
+        if duration > self.budget:
+            self._counts[bisect.bisect_left(self.buckets, duration)] += 1
+
+    def _watch(self) -> None:
+        while not self._stop_event.wait(self.budget / 4):
+            callback, invocation = self._callback, self._invocation
+            if callback is None or invocation == self._reported:
+                continue
+
+            duration = perf_counter() - self._started
+            if duration <= self.budget:
+                continue
+
+            frame = sys._current_frames().get(self._thread_id)
+            stack = [] if frame is None else traceback.format_stack(frame)
+            stall = Stall(_callback_name(callback._callback)[0], duration, stack)
+
+            self._reported = invocation
+            self.stalls.append(stall)
+            if self.on_stall is not None:
+                self.on_stall(stall)
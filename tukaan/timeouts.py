@@ -1,12 +1,224 @@
+from __future__ import annotations
+
+import asyncio
 import functools
-from typing import Any, Callable
+import heapq
+import itertools
+import math
+import traceback
+import warnings
+from time import monotonic, perf_counter
+from typing import Any, Callable, Coroutine, Generator, Iterator
 
+from tukaan._collect import counter
 from tukaan._tcl import Tcl, TclCallback
 from tukaan._typing import P, T, WrappedFunction
 
+_TICK = 0.001  # seconds
+_SLOT_BITS = 6
+_SLOTS = 1 << _SLOT_BITS
+_LEVELS = 4
+
+
+class TimerHandle:
+    __slots__ = ("tick", "callback", "args", "_bucket")
+
+    def __init__(self, tick: int, callback: Callable[..., Any], args: tuple[Any, ...]) -> None:
+        self.tick = tick
+        self.callback = callback
+        self.args = args
+        self._bucket: dict[TimerHandle, None] | None = None
+
+    @property
+    def pending(self) -> bool:
+        return self._bucket is not None
+
+
+class TimerWheel:
+    """
+    A hierarchical timer wheel, with millisecond ticks.
+
+    Level `n` has 64 slots, each covering 64 ** n ticks. Timers are moved to
+    lower levels as their deadline gets closer, so adding and cancelling a
+    timer is O(1). All timers share a single Tcl `after`, that is armed for
+    the earliest tick that has something to do. While an asyncio loop runs
+    inside the Tk loop, the wheel is armed with an asyncio timer instead.
+    """
+
+    def __init__(self) -> None:
+        self._origin = monotonic()
+        self._current = 0
+        self._wheels: list[list[dict[TimerHandle, None]]] = [
+            [{} for _ in range(_SLOTS)] for _ in range(_LEVELS)
+        ]
+        self._overflow: dict[TimerHandle, None] = {}
+        self._command: TclCallback | None = None
+        self._after_id: str | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_handle: asyncio.TimerHandle | None = None
+        self._on_loop_armed: Callable[[], Any] | None = None
+        self._armed_tick: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._overflow) + sum(len(slot) for wheel in self._wheels for slot in wheel)
+
+    def call_at(self, deadline: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """Call `callback` at `deadline` (a :func:`time.monotonic` timestamp)."""
+        tick = max(math.ceil((deadline - self._origin) / _TICK), self._current)
+        handle = TimerHandle(tick, callback, args)
+        self._place(handle)
+
+        if self._armed_tick is None or tick < self._armed_tick:
+            self._arm()
+
+        return handle
+
+    def call_later(self, seconds: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        return self.call_at(monotonic() + seconds, callback, *args)
+
+    def use_loop(
+        self,
+        loop: asyncio.AbstractEventLoop | None,
+        on_armed: Callable[[], Any] | None = None,
+    ) -> None:
+        """
+        Arm the wheel with timers of `loop`, instead of a Tcl `after`.
+        `on_armed` is called after arming, so the loop can reschedule its
+        own wakeup. With `None`, the wheel goes back to Tcl.
+        """
+        self._disarm()
+        self._loop = loop
+        self._on_loop_armed = on_armed
+        self._arm()
+
+    def cancel(self, handle: TimerHandle) -> None:
+        if handle._bucket is not None:
+            del handle._bucket[handle]
+            handle._bucket = None
+
+    def _place(self, handle: TimerHandle) -> None:
+        delta = handle.tick - self._current
+
+        for level in range(_LEVELS):
+            if delta < 1 << (_SLOT_BITS * (level + 1)):
+                index = (handle.tick >> (_SLOT_BITS * level)) & (_SLOTS - 1)
+                bucket = self._wheels[level][index]
+                break
+        else:
+            bucket = self._overflow
+
+        bucket[handle] = None
+        handle._bucket = bucket
+
+    def _next_tick(self) -> int | None:
+        """Return the earliest tick, when a timer is due or must be moved to a lower level."""
+        result = None
+
+        for level in range(_LEVELS):
+            shift = _SLOT_BITS * level
+            base = self._current >> shift
+            # The slot at the current position of the upper levels has already
+            # been moved down, unless the current tick is exactly on its boundary
+            first = 0 if self._current & ((1 << shift) - 1) == 0 else 1
+
+            for offset in range(first, first + _SLOTS):
+                if self._wheels[level][(base + offset) & (_SLOTS - 1)]:
+                    tick = max((base + offset) << shift, self._current)
+                    if result is None or tick < result:
+                        result = tick
+                    break
+
+        if self._overflow:
+            tick = min(handle.tick for handle in self._overflow) - (1 << (_SLOT_BITS * _LEVELS)) + 1
+            tick = max(tick, self._current)
+            if result is None or tick < result:
+                result = tick
+
+        return result
+
+    def _process_tick(self, tick: int) -> list[TimerHandle]:
+        self._current = tick
+
+        if self._overflow:
+            for handle in list(self._overflow):
+                if handle.tick - tick < 1 << (_SLOT_BITS * _LEVELS):
+                    del self._overflow[handle]
+                    self._place(handle)
+
+        for level in range(_LEVELS - 1, 0, -1):
+            shift = _SLOT_BITS * level
+            if tick & ((1 << shift) - 1) == 0:
+                bucket = self._wheels[level][(tick >> shift) & (_SLOTS - 1)]
+                handles = list(bucket)
+                bucket.clear()
+                for handle in handles:
+                    self._place(handle)
+
+        bucket = self._wheels[0][tick & (_SLOTS - 1)]
+        due = list(bucket)
+        bucket.clear()
+        for handle in due:
+            handle._bucket = None
+
+        self._current = tick + 1
+        return due
+
+    def _run(self) -> None:
+        self._after_id = self._loop_handle = self._armed_tick = None
+        now = math.floor((monotonic() - self._origin) / _TICK)
+
+        while True:
+            tick = self._next_tick()
+            if tick is None or tick > now:
+                break
+
+            for handle in self._process_tick(tick):
+                try:
+                    handle.callback(*handle.args)
+                except Exception:
+                    print("Exception in Tukaan timer callback:")
+                    print(traceback.format_exc())
+
+        self._current = max(self._current, now + 1)
+        self._arm()
+
+    def _arm(self) -> None:
+        tick = self._next_tick()
+        if tick == self._armed_tick:
+            return
+
+        self._disarm()
+        if tick is None:
+            return
+
+        delay = self._origin + tick * _TICK - monotonic()
+        if self._loop is not None:
+            self._loop_handle = self._loop.call_at(self._loop.time() + delay, self._run)
+            self._armed_tick = tick
+            if self._on_loop_armed is not None:
+                self._on_loop_armed()
+            return
+
+        if self._command is None:
+            self._command = TclCallback(self._run)
+
+        self._after_id = Tcl.call(str, "after", max(0, math.ceil(delay * 1000)), self._command)
+        self._armed_tick = tick
+
+    def _disarm(self) -> None:
+        if self._after_id is not None:
+            Tcl.call(None, "after", "cancel", self._after_id)
+        if self._loop_handle is not None:
+            self._loop_handle.cancel()
+
+        self._after_id = self._loop_handle = self._armed_tick = None
+
+
+timer_wheel = TimerWheel()
+
 
 class Timeout:
-    _after_id: str = ""
+    _handle: TimerHandle | None = None
     _repeat: bool = False
     state: str = "not started"
 
@@ -17,6 +229,7 @@ class Timeout:
 
         self.seconds = seconds
         self.target = target
+        self._deadline = 0.0
 
     def __repr__(self) -> str:
         name = self.target.__name__
@@ -37,20 +250,30 @@ class Timeout:
         self.run_once()
 
     def run(self):
+        self._handle = None
         try:
             self.target()
-            if self._repeat:
-                return self.start()
         except Exception as e:
             print(e)
             self.state = "failed"
+            return
+
+        if self._repeat:
+            # Anchor the next run to the previous deadline, so the interval doesn't drift
+            now = monotonic()
+            self._deadline += self.seconds
+            if self._deadline < now and self.seconds > 0:
+                # Skip the runs that were missed
+                self._deadline += ((now - self._deadline) // self.seconds + 1) * self.seconds
+            self._handle = timer_wheel.call_at(self._deadline, self.__call__)
         else:
             self.state = "succesfully completed"
 
     __call__ = run
 
     def start(self) -> None:
-        self._after_id = Tcl.call(str, "after", int(self.seconds * 1000), self.__call__)
+        self._deadline = monotonic() + self.seconds
+        self._handle = timer_wheel.call_at(self._deadline, self.__call__)
         self.state = "pending"
 
     def repeat(self) -> None:
@@ -61,9 +284,9 @@ class Timeout:
         if self.state != "pending":
             raise RuntimeError(f"cannot cancel a {self.state} timeout")
 
-        command, _ = Tcl.call((str,), "after", "info", self._after_id)
-        Tcl.call(None, "after", "cancel", command)
-        TclCallback.dispose(command)
+        if self._handle is not None:
+            timer_wheel.cancel(self._handle)
+            self._handle = None
 
         self._repeat = False
         self.state = "cancelled"
@@ -77,19 +300,141 @@ class Timeout:
         self._repeat = repeat
 
 
+class _Suspend:
+    __slots__ = ("seconds", "task")
+
+    def __init__(self, seconds: float = 0, task: Task | None = None) -> None:
+        self.seconds = seconds
+        self.task = task
+
+    def __await__(self) -> Generator[_Suspend, Any, Any]:
+        return (yield self)
+
+
+def _in_asyncio_task() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+async def sleep(seconds: float) -> None:
+    """Suspend the current coroutine for `seconds`, without blocking the event loop."""
+    if _in_asyncio_task():
+        await asyncio.sleep(seconds)
+    else:
+        await _Suspend(seconds)
+
+
+class Task:
+    """
+    Run a coroutine on the Tcl event loop, without asyncio.
+
+    The coroutine can await :func:`sleep` and other tasks. Every step runs
+    from the timer wheel, so waiting never starts a nested event loop.
+    An exception of a task is raised again in the coroutines awaiting it.
+    """
+
+    state: str = "pending"
+
+    def __init__(self, coro: Coroutine[Any, Any, Any]) -> None:
+        self._coro = coro
+        self._result: Any = None
+        self._exception: BaseException | None = None
+        self._awaited = False
+        self._handle: TimerHandle | None = timer_wheel.call_later(0, self._step)
+        self._done_callbacks: list[Callable[[Task], Any]] = []
+
+    def __repr__(self) -> str:
+        return f"<{self.state.capitalize()} task at {hex(id(self))}>"
+
+    def __await__(self) -> Generator[_Suspend, Any, Any]:
+        if self.state == "pending":
+            self._awaited = True
+            yield _Suspend(task=self)
+        return self.result()
+
+    def _step(self, value: Any = None) -> None:
+        if self.state != "pending":
+            return  # Cancelled while it was waiting for another task
+
+        self._handle = None
+
+        try:
+            request = self._coro.send(value)
+        except StopIteration as e:
+            self._finish("completed", e.value)
+            return
+        except Exception as e:
+            if not self._awaited:
+                # Otherwise it's raised in the awaiting coroutine
+                print("Exception in Tukaan task:")
+                print(traceback.format_exc())
+            self._exception = e
+            self._finish("failed", None)
+            return
+
+        if not isinstance(request, _Suspend):
+            self._coro.close()
+            self._finish("failed", None)
+            raise TypeError(
+                f"tukaan tasks can only await tukaan.sleep() and tasks, got {request!r}"
+            )
+
+        if request.task is not None:
+            request.task.add_done_callback(lambda _: self._step())
+        else:
+            self._handle = timer_wheel.call_later(request.seconds, self._step)
+
+    def _finish(self, state: str, result: Any) -> None:
+        self.state = state
+        self._result = result
+        for callback in self._done_callbacks:
+            callback(self)
+
+    def add_done_callback(self, callback: Callable[[Task], Any]) -> None:
+        if self.state == "pending":
+            self._done_callbacks.append(callback)
+        else:
+            callback(self)
+
+    def result(self) -> Any:
+        if self.state == "pending":
+            raise RuntimeError("the task hasn't finished yet")
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def cancel(self) -> None:
+        if self.state != "pending":
+            raise RuntimeError(f"cannot cancel a {self.state} task")
+
+        if self._handle is not None:
+            timer_wheel.cancel(self._handle)
+        self._coro.close()
+        self._finish("cancelled", None)
+
+
 class Timer:
     @staticmethod
     def schedule(seconds: float, target: Callable[..., Any], *, args=(), kwargs=None) -> None:
         if kwargs is None:
             kwargs = {}
-        Tcl.call(str, "after", int(seconds * 1000), TclCallback(target, args=args, kwargs=kwargs))
+        timer_wheel.call_later(seconds, functools.partial(target, *args, **kwargs))
 
     @staticmethod
     def wait(seconds: float) -> None:
+        """
+        Block for `seconds` while processing events in a nested event loop.
+        Prefer `await tukaan.sleep(seconds)`, which doesn't nest the event loop.
+        """
+        var = f"tukaan_waitvar_{next(counter['waitvars'])}"
         script = f"""
-        set tukaan_waitvar 0
-        after {int(seconds * 1000)} {{set tukaan_waitvar 1}}
-        tkwait variable tukaan_waitvar"""
+        set {var} 0
+        after {int(seconds * 1000)} {{set {var} 1}}
+        tkwait variable {var}
+        unset {var}"""
 
         Tcl.eval(None, script)
 
@@ -104,3 +449,149 @@ class Timer:
             return wrapper
 
         return decorator
+
+    @staticmethod
+    def delayed_task(seconds: float):
+        """
+        Like :meth:`Timer.delayed`, but without blocking. The calls return a
+        task (an asyncio one when running with App.run_async), and
+        overlapping calls wait independently.
+        """
+
+        def decorator(func: WrappedFunction[P, T]):
+            @functools.wraps(func)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                async def run_delayed() -> T:
+                    await sleep(seconds)
+                    result = func(*args, **kwargs)
+                    if asyncio.iscoroutine(result):
+                        return await result
+                    return result
+
+                return TclCallback.run_coroutine(run_delayed())
+
+            return wrapper
+
+        return decorator
+
+
+class IdleTask:
+    state: str = "pending"
+
+    def __init__(self, generator: Iterator[Any], priority: int, budget: float) -> None:
+        self.generator = generator
+        self.priority = priority
+        self.budget = budget
+        self._last_run = perf_counter()
+        self._starving = False
+
+    def __repr__(self) -> str:
+        return f"<{self.state.capitalize()} idle task at {hex(id(self))}, priority={self.priority}>"
+
+    def cancel(self) -> None:
+        if self.state != "pending":
+            raise RuntimeError(f"cannot cancel a {self.state} idle task")
+
+        self.generator.close()
+        self.state = "cancelled"
+
+
+def _warn_starvation(task: IdleTask, waited: float) -> None:
+    warnings.warn(f"{task!r} hasn't run for {waited * 1000:.0f}ms", RuntimeWarning)
+
+
+class IdleScheduler:
+    """
+    Run generators step by step, while the event loop is idle.
+
+    In each idle slot, the pending tasks are resumed in order of priority
+    (higher first, round-robin among equals), until the smallest budget
+    of the pending tasks is used up. Then the slot ends, so user input is
+    processed before the next slot. Tasks that haven't been resumed for
+    `starvation_ms` are reported to `on_starvation`.
+    """
+
+    def __init__(
+        self,
+        starvation_ms: int = 1000,
+        on_starvation: Callable[[IdleTask, float], Any] | None = _warn_starvation,
+    ) -> None:
+        self.starvation = starvation_ms / 1000
+        self.on_starvation = on_starvation
+
+        self._queue: list[tuple[int, int, IdleTask]] = []
+        self._counter = itertools.count()
+        self._command: TclCallback | None = None
+        self._scheduled = False
+
+    def schedule(self, generator: Iterator[Any], priority: int = 0, budget_ms: int = 8) -> IdleTask:
+        task = IdleTask(generator, priority, budget_ms / 1000)
+        self._push(task)
+        self._wake_up()
+        return task
+
+    def _push(self, task: IdleTask) -> None:
+        heapq.heappush(self._queue, (-task.priority, next(self._counter), task))
+
+    def _wake_up(self, from_slot: bool = False) -> None:
+        if self._scheduled:
+            return
+
+        if self._command is None:
+            self._command = TclCallback(self._run_slot)
+
+        if from_slot:
+            # `update idletasks` would run an idle handler, that reschedules itself,
+            # until the job is done, so the next slot goes through the event loop first
+            Tcl.eval(None, f"after 0 {{after idle {self._command._name}}}")
+        else:
+            Tcl.call(None, "after", "idle", self._command)
+        self._scheduled = True
+
+    def _run_slot(self) -> None:
+        self._scheduled = False
+
+        self._queue = [entry for entry in self._queue if entry[2].state == "pending"]
+        heapq.heapify(self._queue)
+        if not self._queue:
+            return
+
+        start = perf_counter()
+        self._check_starvation(start)
+        deadline = start + min(task.budget for *_, task in self._queue)
+
+        while self._queue and perf_counter() < deadline:
+            *_, task = heapq.heappop(self._queue)
+            if task.state != "pending":
+                continue
+
+            task._last_run = perf_counter()
+            task._starving = False
+            try:
+                next(task.generator)
+            except StopIteration:
+                task.state = "completed"
+                continue
+            except Exception:
+                print("Exception in Tukaan idle task:")
+                print(traceback.format_exc())
+                task.state = "failed"
+                continue
+
+            self._push(task)
+
+        if self._queue:
+            self._wake_up(from_slot=True)
+
+    def _check_starvation(self, now: float) -> None:
+        if self.on_starvation is None:
+            return
+
+        for *_, task in self._queue:
+            waited = now - task._last_run
+            if waited > self.starvation and not task._starving:
+                task._starving = True
+                self.on_starvation(task, waited)
+
+
+idle_scheduler = IdleScheduler()
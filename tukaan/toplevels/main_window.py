@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Callable
 
 from tukaan._base import ToplevelBase
-from tukaan._tcl import Tcl
+from tukaan._tcl import Tcl, TclCallback
 from tukaan.app import App
 from tukaan.enums import WindowType
 from tukaan.exceptions import AppError
@@ -37,17 +37,16 @@ class MainWindow(ToplevelBase, WindowManager):
         Tcl.eval(None, "pack [ttk::frame .app] -expand 1 -fill both")
         Tcl.call(None, "wm", "title", ".", title)
         Tcl.call(None, "wm", "geometry", ".", f"{width}x{height}")
-        Tcl.call(None, "wm", "protocol", ".", "WM_DELETE_WINDOW", self.destroy)
+        command = TclCallback.register(self, "WM_DELETE_WINDOW", self.destroy)
+        Tcl.call(None, "wm", "protocol", ".", "WM_DELETE_WINDOW", command)
 
-        Tcl.call(None, "bind", ".app", "<Map>", self._gen_state_event)
-        Tcl.call(None, "bind", ".app", "<Unmap>", self._gen_state_event)
-        Tcl.call(None, "bind", ".app", "<Configure>", self._gen_state_event)
+        self._track_state()
 
         if type is not None:
             self.type = type
 
         Tcl.call(None, "wm", "deiconify", ".")
-        Tcl.call(None, "update", "idletasks")
+        Tcl.sync()
 
     def destroy(self) -> None:
         App.quit()
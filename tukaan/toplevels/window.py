@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from tukaan._base import ToplevelBase, generate_pathname
+from tukaan._base import ToplevelBase, generate_pathname, release_commands
 from tukaan._collect import widgets
 from tukaan._tcl import Tcl
 from tukaan.app import App
@@ -50,10 +50,8 @@ class Window(ToplevelBase, WindowManager):
         if type is not None:
             self.type = type
 
-        Tcl.call(None, "bind", self._name, "<Map>", self._gen_state_event)
-        Tcl.call(None, "bind", self._name, "<Unmap>", self._gen_state_event)
-        Tcl.call(None, "bind", self._name, "<Configure>", self._gen_state_event)
-        Tcl.call(None, "update", "idletasks")
+        self._track_state()
+        Tcl.sync()
 
     def wait_until_closed(self) -> None:
         Tcl.call(None, "tkwait", "window", self._wm_path)
@@ -64,6 +62,7 @@ class Window(ToplevelBase, WindowManager):
 
     def destroy(self) -> None:
         Tcl.call(None, "destroy", self)
+        release_commands(self)
 
         del self.parent._children[self._name]
         del widgets[self._name]
@@ -1,30 +1,146 @@
 from __future__ import annotations
 
 import functools
-import re
 import sys
 from fractions import Fraction
 from pathlib import Path
-from typing import Callable, Sequence
+from typing import Any, Callable, Sequence
 
 from tukaan._images import Icon
-from tukaan._misc import Position, Size
+from tukaan._misc import GeometrySnapshot, Position, Size
+from tukaan._mixins import geometry_snapshot
 from tukaan._system import Platform
-from tukaan._tcl import Tcl
+from tukaan._tcl import Tcl, TclCallback
 from tukaan.enums import Resizable, WindowState, WindowType
 from tukaan.exceptions import TukaanTclError
 
+_STATE_TRACKING_PROC = """
+namespace eval ::tukaan {
+    variable state_pending
+    variable window_state
+    variable window_size
+    variable state_command
+    variable resize_handler
+    variable resize_after
+}
+proc ::tukaan::schedule_state_check {w} {
+    if {![info exists ::tukaan::state_pending($w)]} {
+        set ::tukaan::state_pending($w) 1
+        after idle [list ::tukaan::check_state $w]
+    }
+}
+proc ::tukaan::check_state {w} {
+    unset -nocomplain ::tukaan::state_pending($w)
+    if {![winfo exists $w]} return
+
+    set state [wm state $w]
+    set size [winfo width $w]x[winfo height $w]
+    set previous $::tukaan::window_state($w)
+
+    if {$state in {normal zoomed}} {
+        # Only moved, so it can't have gone full screen or maximized
+        if {$previous ni {withdrawn iconic} && [info exists ::tukaan::window_size($w)]
+                && $::tukaan::window_size($w) eq $size} {
+            return
+        }
+        set ::tukaan::window_size($w) $size
+
+        if {[wm attributes $w -fullscreen]} {
+            set state fullscreen
+        } elseif {$state eq "normal" && [tk windowingsystem] eq "x11"
+                && [wm attributes $w -zoomed]} {
+            set state zoomed
+        }
+    }
+
+    if {$state ne $previous} {
+        set ::tukaan::window_state($w) $state
+        $::tukaan::state_command($w) $state
+    }
+}
+proc ::tukaan::on_configure {w source target} {
+    # Only the events of the bound widget, not the ones propagated from its children
+    if {$source ne $target} return
+    ::tukaan::schedule_state_check $w
+    if {[info exists ::tukaan::resize_handler($w)]} {
+        lassign $::tukaan::resize_handler($w) command delay
+        if {[info exists ::tukaan::resize_after($w)]} {
+            after cancel $::tukaan::resize_after($w)
+        }
+        set ::tukaan::resize_after($w) [after $delay [list ::tukaan::deliver_resize $w $command]]
+    }
+}
+proc ::tukaan::deliver_resize {w command} {
+    unset -nocomplain ::tukaan::resize_after($w)
+    if {[winfo exists $w]} {
+        $command [winfo width $w] [winfo height $w]
+    }
+}
+"""
+
 
 class WindowStateManager:
     _wm_path: str
+    _name: str
     _current_state = "normal"
+    _state_tracking_ready = False
 
     bind: Callable
     unbind: Callable
 
-    def _gen_state_event(self):
+    def _track_state(self) -> None:
+        """
+        Generate state change events. <Configure> only schedules a check in
+        Tcl, that runs once per frame, and calls back into Python only if the
+        state has actually changed.
+        """
+        if not WindowStateManager._state_tracking_ready:
+            Tcl.eval(None, _STATE_TRACKING_PROC)
+            WindowStateManager._state_tracking_ready = True
+
+        command = TclCallback.register(self, "state", self._gen_state_event)
+        wm_path = self._wm_path
+        Tcl.eval(
+            None,
+            f"""
+            set ::tukaan::window_state({wm_path}) {self._current_state}
+            set ::tukaan::state_command({wm_path}) {command}
+            bind {self._name} <Map> {{::tukaan::schedule_state_check {wm_path}}}
+            bind {self._name} <Unmap> {{::tukaan::schedule_state_check {wm_path}}}
+            bind {self._name} <Configure> {{::tukaan::on_configure {wm_path} %W {self._name}}}
+            """,
+        )
+
+    def on_resize(
+        self, callback: Callable[[Size], Any] | None, debounce_ms: int = 100
+    ) -> Callable[[Size], Any] | None:
+        """
+        Call `callback` with the new size of the window, when it hasn't been
+        resized for `debounce_ms` milliseconds. With a `debounce_ms` of 0,
+        size changes are coalesced to one per frame. Pass None to remove it.
+        """
+        if callback is None:
+            TclCallback.unregister(self, "resize")
+            Tcl.eval(None, f"unset -nocomplain ::tukaan::resize_handler({self._wm_path})")
+            return None
+
+        last_size = None
+
+        def wrapper(width: str, height: str) -> None:
+            nonlocal last_size
+
+            size = Size(int(width), int(height))
+            if size != last_size:
+                last_size = size
+                callback(size)
+
+        command = TclCallback.register(self, "resize", wrapper)
+        delay = debounce_ms or "idle"
+        Tcl.eval(None, f"set ::tukaan::resize_handler({self._wm_path}) {{{command} {delay}}}")
+        return callback
+
+    def _gen_state_event(self, new_state: str) -> None:
         prev_state = self._current_state
-        new_state = self._get_state()
 
         if new_state == prev_state or prev_state == "nostate":
             return
@@ -160,62 +276,55 @@ class WindowGeometryManager:
     _wm_path: str
 
     @property
-    @Tcl.redraw_before
+    def frame(self) -> GeometrySnapshot:
+        """
+        Return the position, size and mapped state of this window, fetched
+        in a single call. Cached until the window is moved or resized.
+        """
+        return geometry_snapshot(self._wm_path)
+
+    @property
     def x(self) -> int:
         """Get or set the position of this window on the x axis."""
-        return Tcl.call(int, "winfo", "x", self._wm_path)
+        return self.frame.rel_x
 
     @x.setter
-    @Tcl.with_redraw
     def x(self, value: int) -> None:
-        y = Tcl.call(int, "winfo", "y", self._wm_path)
-        Tcl.call(None, "wm", "geometry", self._wm_path, f"+{value}+{y}")
+        Tcl.call(None, "wm", "geometry", self._wm_path, f"+{value}+{self.frame.rel_y}")
 
     @property
-    @Tcl.redraw_before
     def y(self) -> int:
         """Get or set the position of this window on the y axis."""
-        return Tcl.call(int, "winfo", "y", self._wm_path)
+        return self.frame.rel_y
 
     @y.setter
-    @Tcl.with_redraw
     def y(self, value: int) -> None:
-        x = Tcl.call(int, "winfo", "x", self._wm_path)
-        Tcl.call(None, "wm", "geometry", self._wm_path, f"+{x}+{value}")
+        Tcl.call(None, "wm", "geometry", self._wm_path, f"+{self.frame.rel_x}+{value}")
 
     @property
-    @Tcl.redraw_before
     def width(self) -> int:
         """Get or set the width of this window."""
-        return Tcl.call(int, "winfo", "width", self._wm_path)
+        return self.frame.width
 
     @width.setter
-    @Tcl.with_redraw
     def width(self, value: int) -> None:
-        height = Tcl.call(int, "winfo", "height", self._wm_path)
-        Tcl.call(None, "wm", "geometry", self._wm_path, f"{value}x{height}")
+        Tcl.call(None, "wm", "geometry", self._wm_path, f"{value}x{self.frame.height}")
 
     @property
-    @Tcl.redraw_before
     def height(self) -> int:
         """Get or set the height of this window."""
-        return Tcl.call(int, "winfo", "width", self._wm_path)
+        return self.frame.height
 
     @height.setter
-    @Tcl.with_redraw
     def height(self, value: int) -> None:
-        width = Tcl.call(int, "winfo", "width", self._wm_path)
-        Tcl.call(None, "wm", "geometry", self._wm_path, f"{width}x{value}")
+        Tcl.call(None, "wm", "geometry", self._wm_path, f"{self.frame.width}x{value}")
 
     @property
-    @Tcl.redraw_before
     def position(self) -> Position:
-        return Position(
-            *map(int, re.split(r"x|\+", Tcl.call(str, "wm", "geometry", self._wm_path))[2:])
-        )
+        frame = self.frame
+        return Position(frame.rel_x, frame.rel_y)
 
     @position.setter
-    @Tcl.redraw_after
     def position(self, value: Position | Sequence[int] | int) -> None:
         if isinstance(value, int):
             value = (value,) * 2
@@ -223,14 +332,11 @@ class WindowGeometryManager:
         Tcl.call(None, "wm", "geometry", self._wm_path, "+{}+{}".format(*value))
 
     @property
-    @Tcl.redraw_before
     def size(self) -> Size:
-        return Size(
-            *map(int, re.split(r"x|\+", Tcl.call(str, "wm", "geometry", self._wm_path))[:2])
-        )
+        frame = self.frame
+        return Size(frame.width, frame.height)
 
     @size.setter
-    @Tcl.redraw_after
     def size(self, value: Size | Sequence[int] | int) -> None:
         if isinstance(value, int):
             value = (value,) * 2
@@ -464,7 +570,8 @@ class WindowManager(WindowGeometryManager, WindowStateManager, WindowDecorationM
             if func(self):
                 self.destroy()
 
-        Tcl.call(None, "wm", "protocol", self._wm_path, "WM_DELETE_WINDOW", wrapper)
+        command = TclCallback.register(self, "WM_DELETE_WINDOW", wrapper)
+        Tcl.call(None, "wm", "protocol", self._wm_path, "WM_DELETE_WINDOW", command)
         return wrapper
 
     @property
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Generator
+from typing import TYPE_CHECKING, Generator
 
 from tukaan._base import OutputDisplay, TkWidget, WidgetBase
 from tukaan._props import FocusableProp, IntDesc, LinkProp, OrientProp, cget, config
@@ -9,6 +9,9 @@ from tukaan._variables import FloatVar, IntVar
 from tukaan.enums import Orientation, ProgressMode
 from tukaan.timeouts import Timeout
 
+if TYPE_CHECKING:
+    from tukaan._background import BackgroundTask
+
 
 class ProgressBar(WidgetBase, OutputDisplay):
     _tcl_class = "ttk::progressbar"
@@ -42,7 +45,6 @@ class ProgressBar(WidgetBase, OutputDisplay):
             takefocus=focusable,
             value=value,
             variable=link,
-            **kwargs,
         )
 
     def _repr_details(self) -> str:
@@ -59,6 +61,14 @@ class ProgressBar(WidgetBase, OutputDisplay):
         if self._timeout is not None:
             self._timeout.cancel()
 
+    def track(self, task: BackgroundTask) -> None:
+        """Follow the progress of a task started with :meth:`App.run_in_background`."""
+        self.value = round(task.progress * self._max)
+        task.add_progress_callback(
+            lambda fraction: setattr(self, "value", round(fraction * self._max))
+        )
+        task.add_done_callback(lambda _: setattr(self, "value", self._max))
+
     def through(self) -> Generator[int, None, None]:
         self.value = 0
         yield 0
@@ -6,7 +6,7 @@ from tukaan._base import InputControl, TkWidget, WidgetBase
 from tukaan._props import CommandProp, FocusableProp, LinkProp, TextProp, WidthProp, cget, config
 from tukaan._tcl import Tcl
 from tukaan._variables import ControlVariable, StringVar
-from tukaan.enums import Orientation
+from tukaan.enums import Align, Orientation
 from tukaan.widgets.frame import Frame
 
 
@@ -111,11 +111,12 @@ class RadioGroup(Frame, InputControl):
     def _regrid(self) -> None:
         is_vert = self._orient is Orientation.Vertical
 
-        for index, radio in enumerate(self._items.values()):
-            if is_vert:
-                Tcl.call(None, "grid", radio, "-row", index, "-column", 0, "-sticky", "w")
-            else:
-                Tcl.call(None, "grid", radio, "-row", 0, "-column", index)
+        with Tcl.batch():
+            for index, radio in enumerate(self._items.values()):
+                if is_vert:
+                    radio.grid(index, 0, align=(Align.Start, None))
+                else:
+                    radio.grid(0, index)
 
     def __getitem__(self, item: str) -> RadioButton | None:
         return self._items[item]
@@ -61,8 +61,7 @@ class Slider(WidgetBase, InputControl):
     @bounds.setter
     def bounds(self, value: tuple[float, float]) -> None:
         from_, to = value
-        config(self, from_=from_)
-        config(self, to=to)
+        config(self, from_=from_, to=to)
 
     @property
     def min(self) -> float:
@@ -7,6 +7,7 @@ from typing import Callable
 from PIL import Image
 
 from tukaan._base import Container, TkWidget, WidgetBase
+from tukaan._events import MouseEvent
 from tukaan._images import Icon, Pillow2Tcl
 from tukaan._props import FocusableProp, _convert_padding, _convert_padding_back
 from tukaan._tcl import Tcl
@@ -196,10 +197,10 @@ class TabView(WidgetBase, Container):
         Tcl.call(None, "ttk::notebook::enableTraversal", self)
 
     def enable_tab_dragging(self) -> None:
-        self.events.bind("<Button1-Motion>", self._on_tab_drag, send_event=True)
+        self.bind("<MouseDrag:Left>", self._on_tab_drag, send=True)
 
-    def _on_tab_drag(self, event) -> bool | None:
-        x, y = event.x, event.y
+    def _on_tab_drag(self, event: MouseEvent) -> bool | None:
+        x, y = event.rel_x, event.rel_y
 
         if Tcl.call(str, self, "identify", x, y) == "Notebook.tab":
             # I'm using 'Notebook.tab' here, 'coz when the tab has a big image,
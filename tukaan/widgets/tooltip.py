@@ -29,7 +29,7 @@ class ToolTipProvider:
         Tcl.eval(None, "pack [ttk::label .tooltip.label -style Tooltip] -expand 1 -fill both")
         Tcl.call(None, "wm", "overrideredirect", ".tooltip", 1)
 
-        if Tcl.call(str, "tk", "windowingsystem") == "x11":
+        if Tcl.windowing_system == "x11":
             Tcl.call(None, "wm", "attributes", ".tooltip", "-type", "tooltip")
 
         cls._setup_done = True